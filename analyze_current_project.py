@@ -5,19 +5,28 @@ Analyze Current Project for Railway Deployment Issues
 
 This script analyzes the current project (project-xavier) for common
 Railway deployment issues and provides specific recommendations.
+
+Usage:
+    python3 analyze_current_project.py [project_path]
 """
 
+import argparse
 import os
 import json
 import re
+import sys
 from pathlib import Path
+from typing import Optional
+
+from bundle_analyzer import analyze_bundle, format_bundle_analysis
+from server_perf_checker import check_server_performance, format_finding
 
-def analyze_current_project():
+def analyze_current_project(project_root: Optional[Path] = None, record_bundle: bool = False):
     """Analyze the current project for Railway deployment issues."""
     print("🔍 Analyzing Current Project for Railway Deployment Issues")
     print("=" * 60)
     
-    project_root = Path(__file__).parent
+    project_root = project_root or Path(__file__).parent
     issues = []
     recommendations = []
     
@@ -72,6 +81,16 @@ def analyze_current_project():
             issues.append("Server doesn't bind to PORT variable")
             recommendations.append("Update to: app.listen(PORT, () => { ... })")
     
+    # Check server sources for performance anti-patterns
+    print("\n⚡ Checking server performance...")
+    perf_findings = check_server_performance(project_root)
+    if perf_findings:
+        for finding in perf_findings:
+            print(f"   ⚠️  {format_finding(finding)}")
+            issues.append(format_finding(finding))
+    else:
+        print("   ✅ No performance anti-patterns found")
+    
     # Check for environment variable usage
     print("\n🔧 Checking environment variable usage...")
     env_vars_found = set()
@@ -135,6 +154,27 @@ def analyze_current_project():
             issues.append("Hardcoded port 3000 found")
             recommendations.append("Replace hardcoded port with process.env.PORT")
     
+    # Check built frontend bundle
+    print("\n📦 Checking frontend bundle...")
+    bundle = analyze_bundle(project_root, record=record_bundle)
+    if bundle is None:
+        print("   ⚠️  No dist/ build output found (run: npm run build)")
+    else:
+        for line in format_bundle_analysis(bundle):
+            print(line)
+        
+        for violation in bundle['violations']:
+            issues.append(violation)
+        for regression in bundle['diff']['regressions']:
+            issues.append(f"Bundle {regression['chunk']} grew {regression['delta'] / 1024:.1f}KB gzip since previous build")
+        
+        if bundle['violations'] or bundle['diff']['regressions']:
+            heavy = [m['module'] for m in bundle['stats']['largest_modules'][:3]]
+            if heavy:
+                recommendations.append(f"Largest bundle contributors: {', '.join(heavy)}")
+            recommendations.append("Lazy-load heavy views (e.g. recharts charts) with React.lazy and dynamic import()")
+            recommendations.append("Import lucide-react icons individually and check build.rollupOptions.output.manualChunks")
+    
     # Generate report
     print("\n" + "=" * 60)
     print("📊 ANALYSIS REPORT")
@@ -162,6 +202,21 @@ def analyze_current_project():
     
     return len(issues) == 0
 
+def main():
+    parser = argparse.ArgumentParser(description='Analyze a project for Railway deployment issues')
+    parser.add_argument('project_path', nargs='?', default=None,
+                        help='Project directory (defaults to this script\'s directory)')
+    parser.add_argument('--record-bundle', action='store_true',
+                        help='Store the current dist/ build as the baseline for bundle size diffs')
+    args = parser.parse_args()
+    
+    project_root = Path(args.project_path) if args.project_path else None
+    if project_root and not project_root.exists():
+        print(f"❌ Project path does not exist: {project_root}")
+        sys.exit(1)
+    
+    success = analyze_current_project(project_root, record_bundle=args.record_bundle)
+    sys.exit(0 if success else 1)
+
 if __name__ == "__main__":
-    success = analyze_current_project()
-    exit(0 if success else 1)
\ No newline at end of file
+    main()
\ No newline at end of file
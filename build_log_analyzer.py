@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Build Log Step-Timing Analyzer
+==============================
+
+Parses Nixpacks / Docker BuildKit build logs into a per-step duration table,
+flags cache misses and slow dependency-install / bundling phases, and compares
+each build against a stored per-repository baseline to catch build-time
+regressions.
+
+Usage:
+    python3 build_log_analyzer.py build.log --repo project-xavier
+    python3 build_log_analyzer.py build.log --repo project-xavier --update-baseline
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_BASELINE_FILE = "build_baselines.json"
+
+# Seconds before a phase is reported as slow
+DEFAULT_THRESHOLDS = {
+    'npm_install': 60.0,
+    'vite_build': 60.0,
+    'step': 120.0,
+}
+
+# A step regresses when it is both this much slower (relative) and at least
+# REGRESSION_MIN_SECONDS slower than the baseline
+REGRESSION_TOLERANCE = 0.25
+REGRESSION_MIN_SECONDS = 10.0
+
+# Checked in order; build commands first so `yarn build` is not read as an install.
+# Bare `yarn` only counts as an install when no other subcommand follows it.
+PHASE_PATTERNS = {
+    'vite_build': re.compile(r'\b(vite\s+build|npm\s+run\s+build|(yarn|pnpm)(\s+run)?\s+build)\b'),
+    'npm_install': re.compile(r'\b(npm\s+(ci|install|i)|pnpm\s+(i|install)|yarn\s+install)\b'
+                             r'|\byarn(?=\s*($|&&|;|\|\||-))'),
+}
+
+TIMESTAMP_RE = re.compile(
+    r'^\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\]?\s*'
+)
+BUILDKIT_LINE_RE = re.compile(r'^#(\d+)\s+(.*)$')
+BUILDKIT_DONE_RE = re.compile(r'^DONE\s+([\d.]+)s')
+BUILDKIT_OUTPUT_RE = re.compile(r'^(\d+\.\d+)\s')
+BUILDKIT_LABEL_RE = re.compile(r'^\[([^\]]+)\]\s*(.*)$')
+LEGACY_STEP_RE = re.compile(r'^Step\s+(\d+)/(\d+)\s*:\s*(.*)$')
+LEGACY_CACHE_RE = re.compile(r'^\s*--->\s+Using cache')
+NIXPACKS_PLAN_RE = re.compile(r'^[║|]\s*(setup|install|build|start)\s*[│|]\s*(.*?)\s*[║|]?\s*$')
+MOUNT_OPTION_RE = re.compile(r'--mount=\S+\s*')
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO-ish log timestamp, tolerating Docker's nanosecond precision."""
+    value = value.replace(' ', 'T', 1)
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    value = re.sub(r'(\.\d{6})\d+', r'\1', value)
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def normalize_step_command(command: str) -> str:
+    """Normalize a step command into a stable key for baseline comparison."""
+    command = MOUNT_OPTION_RE.sub('', command)
+    return ' '.join(command.split())
+
+
+def classify_step(command: str) -> Optional[str]:
+    """Return the phase a build step belongs to, if it is one we track."""
+    for phase, pattern in PHASE_PATTERNS.items():
+        if pattern.search(command):
+            return phase
+    return None
+
+
+def _new_step(step_id: str, label: str, command: str, started_at: Optional[datetime]) -> Dict:
+    command = normalize_step_command(command)
+    return {
+        'id': step_id,
+        'label': label,
+        'command': command,
+        'phase': classify_step(command),
+        'duration': None,
+        'cached': False,
+        'status': 'running',
+        'started_at': started_at,
+        'ended_at': None,
+        'last_offset': None,
+    }
+
+
+def parse_build_steps(logs: str) -> Dict:
+    """Parse BuildKit / legacy Docker / Nixpacks output into build steps."""
+    steps: Dict[str, Dict] = {}
+    order: List[str] = []
+    plan: Dict[str, str] = {}
+    legacy_current: Optional[str] = None
+    last_timestamp: Optional[datetime] = None
+
+    for raw_line in logs.splitlines():
+        line = raw_line.rstrip()
+        timestamp = None
+        match = TIMESTAMP_RE.match(line)
+        if match:
+            timestamp = _parse_timestamp(match.group(1))
+            line = line[match.end():]
+            if timestamp:
+                last_timestamp = timestamp
+
+        plan_match = NIXPACKS_PLAN_RE.match(line.strip())
+        if plan_match:
+            plan[plan_match.group(1)] = plan_match.group(2)
+            continue
+
+        buildkit = BUILDKIT_LINE_RE.match(line)
+        if buildkit:
+            step_id, rest = buildkit.group(1), buildkit.group(2).strip()
+            step = steps.get(step_id)
+
+            done = BUILDKIT_DONE_RE.match(rest)
+            if done and step:
+                step['duration'] = float(done.group(1))
+                step['status'] = 'done'
+                step['ended_at'] = timestamp
+            elif rest.startswith('CACHED') and step:
+                step['cached'] = True
+                step['duration'] = 0.0
+                step['status'] = 'cached'
+                step['ended_at'] = timestamp
+            elif rest.startswith(('ERROR', 'CANCELED')) and step:
+                step['status'] = 'error' if rest.startswith('ERROR') else 'canceled'
+                step['ended_at'] = timestamp
+            elif BUILDKIT_OUTPUT_RE.match(rest) and step:
+                step['last_offset'] = float(BUILDKIT_OUTPUT_RE.match(rest).group(1))
+            elif step is None:
+                label_match = BUILDKIT_LABEL_RE.match(rest)
+                if label_match:
+                    label, command = label_match.group(1), label_match.group(2)
+                else:
+                    label, command = '', rest
+                steps[step_id] = _new_step(step_id, ' '.join(label.split()), command, timestamp)
+                order.append(step_id)
+            continue
+
+        legacy = LEGACY_STEP_RE.match(line.strip())
+        if legacy:
+            if legacy_current and steps[legacy_current]['ended_at'] is None:
+                steps[legacy_current]['ended_at'] = timestamp
+            step_id = f"step-{legacy.group(1)}"
+            steps[step_id] = _new_step(step_id, f"{legacy.group(1)}/{legacy.group(2)}",
+                                       legacy.group(3), timestamp)
+            order.append(step_id)
+            legacy_current = step_id
+            continue
+
+        if legacy_current and LEGACY_CACHE_RE.match(line):
+            step = steps[legacy_current]
+            step['cached'] = True
+            step['duration'] = 0.0
+            step['status'] = 'cached'
+
+    # Fill in durations the log did not state explicitly
+    for index, step_id in enumerate(order):
+        step = steps[step_id]
+        if step['duration'] is not None:
+            continue
+        if step['last_offset'] is not None:
+            step['duration'] = step['last_offset']
+            continue
+        ended_at = step['ended_at']
+        if ended_at is None:
+            next_starts = [steps[s]['started_at'] for s in order[index + 1:] if steps[s]['started_at']]
+            ended_at = next_starts[0] if next_starts else last_timestamp
+        if step['started_at'] and ended_at:
+            step['duration'] = max((ended_at - step['started_at']).total_seconds(), 0.0)
+
+    result_steps = []
+    for step_id in order:
+        step = steps[step_id]
+        if step['status'] == 'running' and step['duration'] is not None:
+            step['status'] = 'done'
+        result_steps.append({
+            'id': step['id'],
+            'label': step['label'],
+            'command': step['command'],
+            'phase': step['phase'],
+            'duration': round(step['duration'], 2) if step['duration'] is not None else None,
+            'cached': step['cached'],
+            'status': step['status'],
+        })
+
+    return {'steps': result_steps, 'nixpacks_plan': plan}
+
+
+def _is_internal(step: Dict) -> bool:
+    return step['label'].startswith(('internal', 'auth')) or not step['command'].startswith(('RUN', 'COPY', 'ADD'))
+
+
+def analyze_build_log(logs: str, baseline: Optional[Dict] = None,
+                      thresholds: Optional[Dict[str, float]] = None) -> Dict:
+    """Build a per-step timing analysis, optionally compared against a baseline."""
+    limits = dict(DEFAULT_THRESHOLDS)
+    if thresholds:
+        limits.update(thresholds)
+
+    parsed = parse_build_steps(logs)
+    steps = parsed['steps']
+    build_steps = [s for s in steps if not _is_internal(s)]
+
+    total_duration = round(sum(s['duration'] or 0.0 for s in steps), 2)
+    cached_steps = [s for s in build_steps if s['cached']]
+    cache_hit_ratio = round(len(cached_steps) / len(build_steps), 2) if build_steps else None
+
+    baseline_steps = (baseline or {}).get('steps', {})
+
+    cache_misses = []
+    slow_phases = []
+    for step in build_steps:
+        previously_cached = baseline_steps.get(step['command'], {}).get('cached', False)
+        if not step['cached'] and (step['phase'] == 'npm_install' or previously_cached):
+            cache_misses.append(step['command'])
+
+        duration = step['duration'] or 0.0
+        limit = limits.get(step['phase'] or 'step', limits['step'])
+        if duration > limit:
+            slow_phases.append({
+                'step': step['command'],
+                'phase': step['phase'] or 'step',
+                'duration': duration,
+                'threshold': limit,
+            })
+
+    regressions = []
+    if baseline:
+        candidates = [('TOTAL', total_duration, baseline.get('total_duration'))]
+        candidates += [(s['command'], s['duration'], baseline_steps.get(s['command'], {}).get('duration'))
+                       for s in build_steps]
+        for name, current, previous in candidates:
+            if current is None or previous is None:
+                continue
+            delta = current - previous
+            if delta >= REGRESSION_MIN_SECONDS and current > previous * (1 + REGRESSION_TOLERANCE):
+                regressions.append({
+                    'step': name,
+                    'baseline': previous,
+                    'current': current,
+                    'delta': round(delta, 2),
+                })
+
+    return {
+        'steps': steps,
+        'nixpacks_plan': parsed['nixpacks_plan'],
+        'total_duration': total_duration,
+        'cache_hit_ratio': cache_hit_ratio,
+        'cache_misses': cache_misses,
+        'slow_phases': slow_phases,
+        'regressions': regressions,
+        'has_baseline': baseline is not None,
+    }
+
+
+def load_build_baselines(path: str = DEFAULT_BASELINE_FILE) -> Dict[str, Dict]:
+    """Load stored per-repository build baselines."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Could not read build baseline {path}: {e}")
+        return {}
+
+
+def save_build_baseline(path: str, repo_name: str, analysis: Dict) -> None:
+    """Record an analyzed build as the new baseline for a repository."""
+    if not analysis['steps']:
+        return
+
+    baselines = load_build_baselines(path)
+    baselines[repo_name] = {
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'total_duration': analysis['total_duration'],
+        'steps': {
+            step['command']: {'duration': step['duration'], 'cached': step['cached']}
+            for step in analysis['steps'] if step['duration'] is not None
+        },
+    }
+
+    with open(path, 'w') as f:
+        json.dump(baselines, f, indent=2)
+
+
+def format_build_analysis(analysis: Dict) -> List[str]:
+    """Render a build analysis as report lines."""
+    lines = []
+    if not analysis['steps']:
+        lines.append("⏱️  BUILD TIMING: no build steps found in logs")
+        return lines
+
+    lines.append(f"⏱️  BUILD TIMING (total {analysis['total_duration']:.1f}s)")
+    if analysis['cache_hit_ratio'] is not None:
+        lines.append(f"  Cache hit ratio: {analysis['cache_hit_ratio']:.0%}")
+    if analysis['nixpacks_plan']:
+        plan = ', '.join(f"{phase}: {cmd}" for phase, cmd in analysis['nixpacks_plan'].items())
+        lines.append(f"  Nixpacks plan: {plan}")
+
+    lines.append(f"  {'DURATION':>9}  {'CACHE':<6} STEP")
+    for step in analysis['steps']:
+        duration = f"{step['duration']:.1f}s" if step['duration'] is not None else "?"
+        cache = "hit" if step['cached'] else "-"
+        lines.append(f"  {duration:>9}  {cache:<6} {step['command'][:80]}")
+
+    for command in analysis['cache_misses']:
+        lines.append(f"  ⚠️  Cache miss: {command}")
+    for slow in analysis['slow_phases']:
+        lines.append(f"  🐢 Slow {slow['phase'].replace('_', ' ')}: {slow['step']} "
+                     f"took {slow['duration']:.1f}s (threshold {slow['threshold']:.0f}s)")
+    for regression in analysis['regressions']:
+        lines.append(f"  📈 Regression: {regression['step']} {regression['baseline']:.1f}s → "
+                     f"{regression['current']:.1f}s (+{regression['delta']:.1f}s)")
+
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze build step timings from a Nixpacks/Docker build log')
+    parser.add_argument('log_file', help='Path to the build log ("-" for stdin)')
+    parser.add_argument('--repo', default=None, help='Repository name used for the baseline (defaults to log file name)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_FILE, help='Baseline file path')
+    parser.add_argument('--update-baseline', action='store_true', help='Store this build as the new baseline')
+    parser.add_argument('--json', action='store_true', help='Print the analysis as JSON')
+
+    args = parser.parse_args()
+
+    if args.log_file == '-':
+        logs = sys.stdin.read()
+    else:
+        if not os.path.exists(args.log_file):
+            print(f"❌ Log file does not exist: {args.log_file}")
+            sys.exit(1)
+        with open(args.log_file, 'r', encoding='utf-8', errors='replace') as f:
+            logs = f.read()
+
+    repo_name = args.repo or os.path.splitext(os.path.basename(args.log_file))[0]
+    baseline = load_build_baselines(args.baseline).get(repo_name)
+    analysis = analyze_build_log(logs, baseline=baseline)
+
+    if args.json:
+        print(json.dumps(analysis, indent=2))
+    else:
+        print("\n".join(format_build_analysis(analysis)))
+
+    if args.update_baseline:
+        save_build_baseline(args.baseline, repo_name, analysis)
+        if not args.json:
+            print(f"✅ Baseline updated for {repo_name} in {args.baseline}")
+
+    sys.exit(1 if analysis['regressions'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Frontend Bundle Analyzer
+========================
+
+Reads the `vite build` output in `dist/` (and Vite's manifest when present) to
+report per-chunk raw / gzip / brotli sizes, the initial-load cost of the entry
+chunks, and the largest modules found in sourcemaps. Sizes are checked against
+configurable budgets and diffed against the previous build.
+
+Usage:
+    python3 bundle_analyzer.py [project_path] [--record]
+
+Pass --record after a fresh build to store it as the baseline for the next diff;
+without it the analyzer only reads `.bundle-stats.json`.
+
+Budgets can be overridden with a `bundle-budget.json` in the project root:
+    {"initial_gzip_kb": 200, "chunk_gzip_kb": 150, "total_gzip_kb": 500}
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_BUDGETS = {
+    'initial_gzip_kb': 200,
+    'chunk_gzip_kb': 150,
+    'total_gzip_kb': 500,
+}
+BUDGET_FILE = "bundle-budget.json"
+STATS_FILE = ".bundle-stats.json"
+
+# Growth of a chunk (or the initial load) over the previous build that is
+# reported as a regression: both relative and absolute, in gzip bytes
+GROWTH_TOLERANCE = 0.10
+GROWTH_MIN_BYTES = 5 * 1024
+
+TOP_MODULES = 10
+# Deployed asset types; .map files are excluded since browsers never load them
+ASSET_EXTENSIONS = ('.js', '.mjs', '.css', '.html', '.svg', '.json', '.wasm')
+VITE_HASH_RE = re.compile(r'-[A-Za-z0-9_-]{8}(?=\.[a-z]+$)')
+NODE_MODULE_RE = re.compile(r'node_modules/((?:@[^/]+/)?[^/]+)')
+
+
+def _kb(size: Optional[int]) -> str:
+    return f"{size / 1024:.1f}KB" if size is not None else "n/a"
+
+
+def chunk_key(file_name: str, manifest_src: Optional[str] = None) -> str:
+    """Stable key for matching a chunk across builds.
+
+    Entry and dynamic-import chunks use their manifest source path; other files
+    fall back to the file name without Vite's content hash, which several
+    chunks (e.g. index-<hash>.js) may share.
+    """
+    return manifest_src or VITE_HASH_RE.sub('', file_name)
+
+
+def compressed_sizes(data: bytes) -> Dict[str, Optional[int]]:
+    """Return raw, gzip and brotli sizes (brotli only when the module is installed)."""
+    return {
+        'raw': len(data),
+        'gzip': len(gzip.compress(data, compresslevel=9)),
+        'brotli': len(brotli.compress(data)) if brotli else None,
+    }
+
+
+def load_vite_manifest(dist_path: Path) -> Dict:
+    """Load Vite's build manifest (Vite 5 writes it under .vite/)."""
+    for candidate in (dist_path / ".vite" / "manifest.json", dist_path / "manifest.json"):
+        if candidate.exists():
+            try:
+                with open(candidate, 'r') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return {}
+    return {}
+
+
+def _initial_files(manifest: Dict) -> List[str]:
+    """Files loaded on first page view: entries, their static imports and CSS."""
+    files = []
+    seen = set()
+    stack = [key for key, chunk in manifest.items() if chunk.get('isEntry')]
+    while stack:
+        key = stack.pop()
+        if key in seen or key not in manifest:
+            continue
+        seen.add(key)
+        chunk = manifest[key]
+        files.append(chunk['file'])
+        files.extend(chunk.get('css', []))
+        stack.extend(chunk.get('imports', []))
+    return files
+
+
+def largest_modules(dist_path: Path, limit: int = TOP_MODULES) -> List[Dict]:
+    """Approximate per-module contribution from sourcemap sourcesContent.
+
+    node_modules sources are grouped by package so heavy dependencies like
+    recharts show up as a single line.
+    """
+    modules: Dict[str, int] = {}
+    for map_path in dist_path.rglob("*.js.map"):
+        try:
+            with open(map_path, 'r', encoding='utf-8') as f:
+                source_map = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+
+        sources = source_map.get('sources', [])
+        contents = source_map.get('sourcesContent') or []
+        for source, content in zip(sources, contents):
+            if content is None:
+                continue
+            package = NODE_MODULE_RE.search(source)
+            name = package.group(1) if package else re.sub(r'^(\.\./)+', '', source)
+            modules[name] = modules.get(name, 0) + len(content.encode('utf-8'))
+
+    ranked = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [{'module': name, 'source_bytes': size} for name, size in ranked]
+
+
+def collect_bundle_stats(dist_path: Path) -> Dict:
+    """Measure every emitted asset in a Vite dist directory."""
+    manifest = load_vite_manifest(dist_path)
+    initial = set(_initial_files(manifest))
+    names = {chunk['file']: chunk.get('name') or chunk.get('src') or key
+             for key, chunk in manifest.items()}
+    sources = {chunk['file']: chunk['src'] for chunk in manifest.values() if chunk.get('src')}
+
+    chunks = []
+    for path in sorted(dist_path.rglob("*")):
+        if not path.is_file() or path.suffix not in ASSET_EXTENSIONS:
+            continue
+        relative = path.relative_to(dist_path).as_posix()
+        if relative.startswith('.vite/') or relative == 'manifest.json':
+            continue
+        with open(path, 'rb') as f:
+            sizes = compressed_sizes(f.read())
+        chunks.append({
+            'file': relative,
+            'key': chunk_key(relative, sources.get(relative)),
+            'source': names.get(relative),
+            'initial': relative in initial,
+            **sizes,
+        })
+
+    chunks.sort(key=lambda chunk: chunk['gzip'], reverse=True)
+    fingerprint = hashlib.sha256(
+        "".join(f"{c['file']}:{c['raw']}" for c in sorted(chunks, key=lambda c: c['file'])).encode()
+    ).hexdigest()
+
+    return {
+        'build_id': fingerprint,
+        'has_manifest': bool(manifest),
+        'chunks': chunks,
+        'total_gzip': sum(c['gzip'] for c in chunks),
+        'initial_gzip': sum(c['gzip'] for c in chunks if c['initial']) if manifest else None,
+        'largest_modules': largest_modules(dist_path),
+    }
+
+
+def load_budgets(project_root: Path) -> Dict[str, float]:
+    """Merge a project's bundle-budget.json over the default budgets."""
+    budgets = dict(DEFAULT_BUDGETS)
+    budget_path = project_root / BUDGET_FILE
+    if budget_path.exists():
+        try:
+            with open(budget_path, 'r') as f:
+                budgets.update(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Could not read {BUDGET_FILE}: {e}")
+    return budgets
+
+
+def check_budgets(stats: Dict, budgets: Dict[str, float]) -> List[str]:
+    """Return a violation message for every exceeded budget."""
+    violations = []
+    total_limit = budgets['total_gzip_kb'] * 1024
+    if stats['total_gzip'] > total_limit:
+        violations.append(f"Bundle total {_kb(stats['total_gzip'])} gzip exceeds budget of "
+                          f"{budgets['total_gzip_kb']}KB")
+
+    initial_limit = budgets['initial_gzip_kb'] * 1024
+    if stats['initial_gzip'] is not None and stats['initial_gzip'] > initial_limit:
+        violations.append(f"Initial load {_kb(stats['initial_gzip'])} gzip exceeds budget of "
+                          f"{budgets['initial_gzip_kb']}KB")
+
+    chunk_limit = budgets['chunk_gzip_kb'] * 1024
+    for chunk in stats['chunks']:
+        if chunk['gzip'] > chunk_limit:
+            violations.append(f"Chunk {chunk['file']} is {_kb(chunk['gzip'])} gzip "
+                              f"(budget {budgets['chunk_gzip_kb']}KB)")
+    return violations
+
+
+def _gzip_by_key(chunks: List[Dict]) -> Dict[str, int]:
+    """Sum gzip sizes per chunk key so chunks sharing a hashless name don't overwrite each other."""
+    totals: Dict[str, int] = {}
+    for chunk in chunks:
+        totals[chunk['key']] = totals.get(chunk['key'], 0) + chunk['gzip']
+    return totals
+
+
+def diff_builds(current: Dict, previous: Optional[Dict]) -> Dict:
+    """Compare gzip sizes against the previous build, matching chunks by chunk_key."""
+    if not previous:
+        return {'has_previous': False, 'changes': [], 'regressions': []}
+
+    before = _gzip_by_key(previous['chunks'])
+    after = _gzip_by_key(current['chunks'])
+
+    changes = []
+    for key in sorted(set(before) | set(after)):
+        old, new = before.get(key, 0), after.get(key, 0)
+        if old != new:
+            changes.append({'chunk': key, 'previous': old, 'current': new, 'delta': new - old})
+
+    regressions = [c for c in changes
+                   if c['delta'] >= GROWTH_MIN_BYTES and c['current'] > c['previous'] * (1 + GROWTH_TOLERANCE)]
+
+    for label, field in (('total', 'total_gzip'), ('initial load', 'initial_gzip')):
+        old, new = previous.get(field), current.get(field)
+        if old is None or new is None:
+            continue
+        if new - old >= GROWTH_MIN_BYTES and new > old * (1 + GROWTH_TOLERANCE):
+            regressions.append({'chunk': label, 'previous': old, 'current': new, 'delta': new - old})
+
+    return {'has_previous': True, 'changes': changes, 'regressions': regressions}
+
+
+def load_build_history(stats_path: Path) -> Dict:
+    """Read the recorded build history, if any."""
+    if not stats_path.exists():
+        return {}
+    try:
+        with open(stats_path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def previous_build(history: Dict, stats: Dict) -> Optional[Dict]:
+    """Pick the build to diff against.
+
+    An unchanged dist/ that was already recorded keeps comparing against the
+    build before it rather than against itself.
+    """
+    current = history.get('current')
+    if current and current.get('build_id') == stats['build_id']:
+        return history.get('previous')
+    return current
+
+
+def record_build(stats_path: Path, stats: Dict) -> Optional[Dict]:
+    """Store this build's stats and return the previous build's stats."""
+    history = load_build_history(stats_path)
+    current = history.get('current')
+    if current and current.get('build_id') == stats['build_id']:
+        return history.get('previous')
+
+    with open(stats_path, 'w') as f:
+        json.dump({'current': stats, 'previous': current}, f, indent=2)
+    return current
+
+
+def analyze_bundle(project_root: Path, dist_dir: str = "dist", record: bool = False) -> Optional[Dict]:
+    """Analyze a project's built bundle; returns None when there is no build output.
+
+    The build is only written to the stats history when record is True, so
+    checks and benchmarks can run without side effects.
+    """
+    dist_path = project_root / dist_dir
+    if not dist_path.is_dir():
+        return None
+
+    stats = collect_bundle_stats(dist_path)
+    stats_path = project_root / STATS_FILE
+    if record:
+        previous = record_build(stats_path, stats)
+    else:
+        previous = previous_build(load_build_history(stats_path), stats)
+    budgets = load_budgets(project_root)
+    return {
+        'stats': stats,
+        'budgets': budgets,
+        'violations': check_budgets(stats, budgets),
+        'diff': diff_builds(stats, previous),
+    }
+
+
+def format_bundle_analysis(analysis: Dict, limit: int = 10) -> List[str]:
+    """Render a bundle analysis as report lines."""
+    stats = analysis['stats']
+    lines = [f"   📊 Total: {_kb(stats['total_gzip'])} gzip across {len(stats['chunks'])} files"]
+    if stats['initial_gzip'] is not None:
+        lines.append(f"   🚀 Initial load: {_kb(stats['initial_gzip'])} gzip")
+    else:
+        lines.append("   ℹ️  No Vite manifest found (set build.manifest: true for initial-load sizes)")
+
+    lines.append(f"   {'RAW':>10} {'GZIP':>10} {'BROTLI':>10}  FILE")
+    for chunk in stats['chunks'][:limit]:
+        marker = " *" if chunk['initial'] else ""
+        lines.append(f"   {_kb(chunk['raw']):>10} {_kb(chunk['gzip']):>10} {_kb(chunk['brotli']):>10}  "
+                     f"{chunk['file']}{marker}")
+
+    if stats['largest_modules']:
+        lines.append("   Largest modules (source size from sourcemaps):")
+        for module in stats['largest_modules']:
+            lines.append(f"     {_kb(module['source_bytes']):>10}  {module['module']}")
+    else:
+        lines.append("   ℹ️  Module attribution unavailable: no sourcemaps in dist/ "
+                     "(run npm run build:analyze to see the largest modules)")
+
+    diff = analysis['diff']
+    if diff['has_previous']:
+        if diff['changes']:
+            lines.append("   Changes since previous build (gzip):")
+            for change in diff['changes'][:limit]:
+                sign = '+' if change['delta'] > 0 else '-'
+                lines.append(f"     {sign}{_kb(abs(change['delta'])):>9}  {change['chunk']}")
+        else:
+            lines.append("   ✅ No size changes since previous build")
+
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report Vite bundle sizes against budgets')
+    parser.add_argument('project_path', nargs='?', default='.', help='Project directory')
+    parser.add_argument('--record', action='store_true',
+                        help=f'Store this build in {STATS_FILE} as the baseline for the next diff')
+    args = parser.parse_args()
+
+    project_root = Path(args.project_path)
+    analysis = analyze_bundle(project_root, record=args.record)
+    if analysis is None:
+        print(f"❌ No build output found at {project_root / 'dist'} (run: npm run build)")
+        sys.exit(1)
+
+    print("📦 Bundle analysis")
+    print("\n".join(format_bundle_analysis(analysis)))
+
+    problems = analysis['violations'] + [
+        f"{r['chunk']} grew {_kb(r['delta'])} gzip since previous build" for r in analysis['diff']['regressions']
+    ]
+    for problem in problems:
+        print(f"   ❌ {problem}")
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Codex CLI
+=========
+
+Single entry point for the Railway deployment tools. Each subcommand imports
+only the module that implements it, so `codex --help` and local project checks
+stay cheap enough to run from git hooks and CI steps.
+
+Usage:
+    python3 codex.py <command> [args...]
+    python3 codex.py <command> --help
+
+Startup cost is kept in check by `python3 codex.py bench-startup`.
+"""
+
+import sys
+
+# command -> (module, entry point, summary). Modules are imported on dispatch
+# only; keep this file free of imports beyond sys.
+COMMANDS = {
+    'check': ('analyze_current_project', 'main', 'Check the current project for Railway deployment issues'),
+    'config': ('railway_config_helper', 'main', 'Create or sync railway.json, Procfile and Dockerfile'),
+    'perf': ('server_perf_checker', 'main', 'Scan the Express/SQLite server for performance anti-patterns'),
+    'bundle': ('bundle_analyzer', 'main', 'Report Vite bundle sizes against budgets'),
+    'probe': ('healthcheck_probe', 'main', 'Measure local cold start and healthcheck latency'),
+    'build-log': ('build_log_analyzer', 'main', 'Analyze build step timings from a build log'),
+    'runtime': ('runtime_signals', 'main', 'Extract runtime performance signals from deployment logs'),
+    'analyze': ('railway_deployment_analyzer', 'main', 'Analyze Railway deployments across GitHub repositories'),
+    'bench-startup': ('startup_benchmark', 'main', 'Check CLI import time against the startup budget'),
+}
+
+
+def print_usage() -> None:
+    print("Usage: codex <command> [args...]")
+    print("")
+    print("Commands:")
+    for name, (_, _, summary) in COMMANDS.items():
+        print(f"  {name:<14} {summary}")
+    print("")
+    print("Run 'codex <command> --help' for command options.")
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv:
+        print_usage()
+        sys.exit(1)
+
+    if argv[0] in ('-h', '--help'):
+        print_usage()
+        sys.exit(0)
+
+    command, args = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"❌ Unknown command: {command}")
+        print_usage()
+        sys.exit(1)
+
+    module_name, entry_point, _ = COMMANDS[command]
+    module = __import__(module_name)
+
+    # Subcommand mains parse sys.argv themselves
+    sys.argv = [f"codex {command}"] + args
+    getattr(module, entry_point)()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Local Cold-Start and Healthcheck Latency Probe
+==============================================
+
+Starts the project's start command locally on a random PORT, measures the
+time until the healthcheck first succeeds, then fires a burst of requests at
+the health and API endpoints. Reports cold-start time and p50/p95/p99 latency
+and recommends (or writes) healthcheckTimeout values for railway.json.
+
+Usage:
+    python3 healthcheck_probe.py [project_path]
+    python3 healthcheck_probe.py . --requests 500 --concurrency 20 --endpoint /api/agents
+    python3 healthcheck_probe.py . --write
+"""
+
+import argparse
+import json
+import math
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from railway_config_helper import create_railway_json, write_if_changed
+from runtime_signals import percentile
+
+DEFAULT_START_COMMAND = "npm start"
+DEFAULT_HEALTHCHECK_PATH = "/api/health"
+DEFAULT_API_ENDPOINTS = ["/api/dashboard/stats"]
+
+# How long to wait for the first successful healthcheck before giving up
+STARTUP_TIMEOUT = 300
+POLL_INTERVAL = 0.1
+# Consecutive 4xx responses after which the server is up but the route is missing
+STEADY_4XX_POLLS = 20
+REQUEST_TIMEOUT = 10
+
+# healthcheckTimeout = cold start * headroom + p99 health latency, rounded up
+TIMEOUT_HEADROOM = 2.0
+MIN_HEALTHCHECK_TIMEOUT = 10
+
+
+def load_deploy_config(project_path: str) -> Dict:
+    """Read the deploy section of railway.json, if present."""
+    config_path = os.path.join(project_path, "railway.json")
+    if not os.path.exists(config_path):
+        return {}
+    try:
+        with open(config_path, 'r') as f:
+            return json.load(f).get('deploy', {})
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def find_free_port() -> int:
+    """Ask the OS for an unused local port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def timed_get(url: str) -> Dict:
+    """GET a URL and return its status and latency in milliseconds."""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=REQUEST_TIMEOUT) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, OSError):
+        status = None
+    return {'status': status, 'latency_ms': (time.perf_counter() - start) * 1000}
+
+
+def wait_for_healthcheck(process: subprocess.Popen, url: str,
+                         timeout: float = STARTUP_TIMEOUT) -> Tuple[Optional[float], Optional[int]]:
+    """Poll the healthcheck until it returns 2xx.
+
+    Gives up early when the server keeps answering with the same 4xx, since
+    waiting won't make a missing route appear.
+    Returns (seconds since start or None, last HTTP status seen).
+    """
+    start = time.perf_counter()
+    status = None
+    client_errors = 0
+    while time.perf_counter() - start < timeout:
+        if process.poll() is not None:
+            break
+        previous, status = status, timed_get(url)['status']
+        if status and 200 <= status < 300:
+            return time.perf_counter() - start, status
+        client_errors = client_errors + 1 if status and 400 <= status < 500 and status == previous else 0
+        if client_errors >= STEADY_4XX_POLLS:
+            break
+        time.sleep(POLL_INTERVAL)
+    return None, status
+
+
+def run_burst(url: str, requests: int, concurrency: int) -> Dict:
+    """Fire a burst of GET requests and summarize latency percentiles."""
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed_get, [url] * requests))
+
+    latencies = [r['latency_ms'] for r in results if r['status'] and r['status'] < 400]
+    return {
+        'url': url,
+        'requests': requests,
+        'errors': requests - len(latencies),
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+    }
+
+
+def stop_process(process: subprocess.Popen) -> None:
+    """Stop the start command and any children it spawned (npm -> node)."""
+    if process.poll() is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=10)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+def recommend_healthcheck_timeout(cold_start: float, health_p99_ms: Optional[float]) -> int:
+    """Healthcheck timeout (seconds) with headroom over the measured cold start."""
+    p99_seconds = (health_p99_ms or 0) / 1000
+    return max(MIN_HEALTHCHECK_TIMEOUT, math.ceil(cold_start * TIMEOUT_HEADROOM + p99_seconds))
+
+
+def probe_project(project_path: str, start_command: Optional[str] = None,
+                  healthcheck_path: Optional[str] = None, endpoints: Optional[List[str]] = None,
+                  requests: int = 200, concurrency: int = 10) -> Dict:
+    """Start the project locally and measure cold start and request latency."""
+    deploy = load_deploy_config(project_path)
+    start_command = start_command or deploy.get('startCommand') or DEFAULT_START_COMMAND
+    healthcheck_path = healthcheck_path or deploy.get('healthcheckPath') or DEFAULT_HEALTHCHECK_PATH
+    endpoints = endpoints if endpoints is not None else DEFAULT_API_ENDPOINTS
+
+    port = find_free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = dict(os.environ, PORT=str(port))
+
+    failure = {
+        'start_command': start_command,
+        'healthcheck_path': healthcheck_path,
+        'cold_start_seconds': None,
+        'exit_code': None,
+        'last_status': None,
+        'output_tail': '',
+        'bursts': [],
+    }
+
+    print(f"🚀 Starting '{start_command}' on PORT={port}")
+    with tempfile.TemporaryFile() as output:
+        # Run through the shell like Railway does, so `cd server && node index.js`
+        # and `NODE_ENV=production npm start` behave the same locally
+        try:
+            process = subprocess.Popen(['sh', '-c', start_command], cwd=project_path, env=env,
+                                       stdout=output, stderr=subprocess.STDOUT, start_new_session=True)
+        except OSError as e:
+            return dict(failure, output_tail=f"Could not start '{start_command}': {e}")
+
+        try:
+            cold_start, last_status = wait_for_healthcheck(process, base_url + healthcheck_path)
+            if cold_start is None:
+                output.seek(0)
+                return dict(failure,
+                            exit_code=process.poll(),
+                            last_status=last_status,
+                            output_tail=output.read().decode('utf-8', errors='replace')[-2000:])
+
+            print(f"✅ Healthcheck passed after {cold_start:.2f}s")
+            bursts = []
+            for path in [healthcheck_path] + [e for e in endpoints if e != healthcheck_path]:
+                print(f"📊 Sending {requests} requests to {path} ({concurrency} concurrent)")
+                bursts.append(run_burst(base_url + path, requests, concurrency))
+        finally:
+            stop_process(process)
+
+    return {
+        'start_command': start_command,
+        'healthcheck_path': healthcheck_path,
+        'cold_start_seconds': round(cold_start, 3),
+        'bursts': bursts,
+        'current_timeout': deploy.get('healthcheckTimeout'),
+        'recommended_timeout': recommend_healthcheck_timeout(cold_start, bursts[0]['p99_ms']),
+    }
+
+
+def write_healthcheck_config(project_path: str, healthcheck_path: str, timeout: int,
+                             start_command: Optional[str] = None) -> None:
+    """Update healthcheckPath/healthcheckTimeout in railway.json, creating it if needed."""
+    config_path = os.path.join(project_path, "railway.json")
+    if not os.path.exists(config_path):
+        node_project = os.path.exists(os.path.join(project_path, "package.json"))
+        create_railway_json(project_path, node_project=node_project,
+                            healthcheck_path=healthcheck_path, healthcheck_timeout=timeout,
+                            start_command=start_command)
+        return
+
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+    config.setdefault('deploy', {})
+    config['deploy']['healthcheckPath'] = healthcheck_path
+    config['deploy']['healthcheckTimeout'] = timeout
+
+    if write_if_changed(config_path, json.dumps(config, indent=2)):
+        print(f"✅ Updated healthcheck settings in {config_path}")
+    else:
+        print(f"✅ Healthcheck settings already up to date in {config_path}")
+
+
+def format_probe_report(result: Dict) -> List[str]:
+    """Render a probe result as report lines."""
+    lines = []
+    if result['cold_start_seconds'] is None:
+        lines.append(f"❌ Healthcheck {result['healthcheck_path']} never succeeded "
+                     f"(last status: {result['last_status']}, exit code: {result['exit_code']})")
+        if result['last_status'] and 400 <= result['last_status'] < 500:
+            lines.append(f"💡 The server is up but {result['healthcheck_path']} returns {result['last_status']}; "
+                         "add the route or pass --healthcheck-path")
+        if result['output_tail']:
+            lines.append("📋 Output:")
+            lines.append(result['output_tail'])
+        return lines
+
+    lines.append(f"⏱️  Cold start: {result['cold_start_seconds']:.2f}s to first healthy {result['healthcheck_path']}")
+    lines.append(f"   {'P50':>9} {'P95':>9} {'P99':>9} {'ERRORS':>7}  ENDPOINT")
+    for burst in result['bursts']:
+        if burst['p50_ms'] is None:
+            lines.append(f"   {'-':>9} {'-':>9} {'-':>9} {burst['errors']:>7}  {burst['url']}")
+            continue
+        lines.append(f"   {burst['p50_ms']:>7.1f}ms {burst['p95_ms']:>7.1f}ms {burst['p99_ms']:>7.1f}ms "
+                     f"{burst['errors']:>7}  {burst['url']}")
+
+    current = result['current_timeout']
+    recommended = result['recommended_timeout']
+    lines.append(f"💡 Recommended healthcheckTimeout: {recommended}s (current: {f'{current}s' if current else 'unset'})")
+    if current is not None and current < result['cold_start_seconds']:
+        lines.append(f"   ⚠️  Current timeout ({current}s) is shorter than the measured cold start — "
+                     "deploys will be marked failed")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure local cold start and healthcheck latency')
+    parser.add_argument('project_path', nargs='?', default='.', help='Project directory')
+    parser.add_argument('--start-command', help='Override the start command (default: railway.json or npm start)')
+    parser.add_argument('--healthcheck-path', help='Override the healthcheck path')
+    parser.add_argument('--endpoint', action='append', dest='endpoints',
+                        help='API endpoint to include in the burst (repeatable)')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=10, help='Concurrent requests')
+    parser.add_argument('--write', action='store_true', help='Write the recommended values to railway.json')
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.project_path):
+        print(f"❌ Project path does not exist: {args.project_path}")
+        sys.exit(1)
+
+    result = probe_project(args.project_path, start_command=args.start_command,
+                           healthcheck_path=args.healthcheck_path, endpoints=args.endpoints,
+                           requests=args.requests, concurrency=args.concurrency)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print("\n".join(format_probe_report(result)))
+
+    if result['cold_start_seconds'] is None:
+        sys.exit(1)
+
+    if args.write:
+        write_healthcheck_config(args.project_path, result['healthcheck_path'], result['recommended_timeout'],
+                                 start_command=result['start_command'])
+
+
+if __name__ == "__main__":
+    main()
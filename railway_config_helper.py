@@ -5,16 +5,92 @@ Railway Configuration Helper
 
 This script helps create and validate Railway configuration files
 for your projects to prevent common deployment issues.
+
+Usage:
+    python3 railway_config_helper.py <project_path> [--node|--python]
+    python3 railway_config_helper.py <monorepo_root> --batch [--check] [--jobs N]
+
+Files are written atomically and only when their content changes, so
+unchanged files keep their mtime and don't invalidate Docker layer caches.
 """
 
+import argparse
 import json
 import os
+import re
 import sys
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
+
+DEFAULT_HEALTHCHECK_PATH = "/api/health"
+DEFAULT_HEALTHCHECK_TIMEOUT = 100
+
+ENV_VAR_RE = re.compile(r'process\.env\.(\w+)')
 
-def create_railway_json(project_path: str, node_project: bool = True) -> None:
-    """Create a railway.json configuration file for the project."""
+# Directories never searched for packages or env var usage
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next', 'coverage'}
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Atomically write content to path unless it already has the same content.
+
+    Returns True if the file was written. Unchanged files are left untouched so
+    their mtime (and any Docker layer cache keyed on it) survives.
+    """
+    # tempfile pulls in shutil/random; only pay for it when something is written
+    import tempfile
+    
+    data = content.encode('utf-8')
+    mode = 0o644
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        pass
+    
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def render_railway_json(project_path: str, node_project: bool = True,
+                        healthcheck_path: Optional[str] = None,
+                        healthcheck_timeout: Optional[int] = None,
+                        start_command: Optional[str] = None) -> str:
+    """Render railway.json content for the project.
+
+    Healthcheck settings default to the values already in the project's
+    railway.json (e.g. written by healthcheck_probe.py), then to the defaults.
+    """
+    existing_deploy = {}
+    existing = _read_text(os.path.join(project_path, "railway.json"))
+    if existing:
+        try:
+            existing_deploy = json.loads(existing).get('deploy', {})
+        except (json.JSONDecodeError, AttributeError):
+            existing_deploy = {}
+    
+    if healthcheck_path is None:
+        healthcheck_path = existing_deploy.get('healthcheckPath', DEFAULT_HEALTHCHECK_PATH)
+    if healthcheck_timeout is None:
+        healthcheck_timeout = existing_deploy.get('healthcheckTimeout', DEFAULT_HEALTHCHECK_TIMEOUT)
+    
     railway_config = {
         "$schema": "https://railway.app/railway.schema.json",
         "build": {
@@ -22,8 +98,8 @@ def create_railway_json(project_path: str, node_project: bool = True) -> None:
         },
         "deploy": {
             "startCommand": "npm start",
-            "healthcheckPath": "/api/health",
-            "healthcheckTimeout": 100,
+            "healthcheckPath": healthcheck_path,
+            "healthcheckTimeout": healthcheck_timeout,
             "restartPolicyType": "ON_FAILURE",
             "restartPolicyMaxRetries": 10
         }
@@ -37,24 +113,49 @@ def create_railway_json(project_path: str, node_project: bool = True) -> None:
         railway_config["build"]["buildCommand"] = "pip install -r requirements.txt"
         railway_config["deploy"]["startCommand"] = "python main.py"
     
-    config_path = os.path.join(project_path, "railway.json")
-    
-    with open(config_path, 'w') as f:
-        json.dump(railway_config, f, indent=2)
+    if start_command:
+        railway_config["deploy"]["startCommand"] = start_command
     
-    print(f"✅ Created railway.json at {config_path}")
+    return json.dumps(railway_config, indent=2)
 
-def create_procfile(project_path: str, start_command: str = "npm start") -> None:
+def _report_write(name: str, path: str, changed: bool) -> None:
+    if changed:
+        print(f"✅ Created {name} at {path}")
+    else:
+        print(f"✓  {name} unchanged at {path}")
+
+def create_railway_json(project_path: str, node_project: bool = True,
+                        healthcheck_path: Optional[str] = None,
+                        healthcheck_timeout: Optional[int] = None,
+                        start_command: Optional[str] = None) -> bool:
+    """Create a railway.json configuration file for the project.
+
+    Run healthcheck_probe.py to measure a healthcheck_timeout that covers the
+    app's cold start instead of relying on the default.
+    """
+    config_path = os.path.join(project_path, "railway.json")
+    content = render_railway_json(project_path, node_project, healthcheck_path, healthcheck_timeout,
+                                  start_command)
+    changed = write_if_changed(config_path, content)
+    _report_write("railway.json", config_path, changed)
+    return changed
+
+def render_procfile(start_command: str = "npm start") -> str:
+    """Render Procfile content."""
+    return f"web: {start_command}\n"
+
+def create_procfile(project_path: str, start_command: str = "npm start") -> bool:
     """Create a Procfile for Railway deployment."""
     procfile_path = os.path.join(project_path, "Procfile")
-    
-    with open(procfile_path, 'w') as f:
-        f.write(f"web: {start_command}\n")
-    
-    print(f"✅ Created Procfile at {procfile_path}")
+    changed = write_if_changed(procfile_path, render_procfile(start_command))
+    _report_write("Procfile", procfile_path, changed)
+    return changed
+
+def check_environment_variables(project_path: str, exclude_dirs: Optional[Set[str]] = None) -> List[str]:
+    """Check for common environment variable issues in the project.
 
-def check_environment_variables(project_path: str) -> List[str]:
-    """Check for common environment variable issues in the project."""
+    exclude_dirs holds absolute paths (e.g. nested packages) not to scan.
+    """
     issues = []
     
     # Check package.json for start script
@@ -73,9 +174,9 @@ def check_environment_variables(project_path: str) -> List[str]:
     # Check for environment variable usage
     env_vars_found = set()
     for root, dirs, files in os.walk(project_path):
-        # Skip node_modules
-        if 'node_modules' in root:
-            continue
+        # Prune node_modules and friends instead of walking into them
+        dirs[:] = [d for d in dirs
+                   if d not in SKIP_DIRS and os.path.abspath(os.path.join(root, d)) not in (exclude_dirs or ())]
             
         for file in files:
             if file.endswith(('.js', '.jsx', '.ts', '.tsx')):
@@ -85,8 +186,7 @@ def check_environment_variables(project_path: str) -> List[str]:
                         content = f.read()
                         
                     # Look for process.env usage
-                    import re
-                    env_matches = re.findall(r'process\.env\.(\w+)', content)
+                    env_matches = ENV_VAR_RE.findall(content)
                     env_vars_found.update(env_matches)
                 except:
                     continue
@@ -99,9 +199,9 @@ def check_environment_variables(project_path: str) -> List[str]:
     
     return issues
 
-def create_dockerfile(project_path: str, node_version: str = "18") -> None:
-    """Create a Dockerfile for Railway deployment."""
-    dockerfile_content = f"""FROM node:{node_version}-alpine
+def render_dockerfile(node_version: str = "18") -> str:
+    """Render Dockerfile content for a Node project."""
+    return f"""FROM node:{node_version}-alpine
 
 WORKDIR /app
 
@@ -123,33 +223,177 @@ EXPOSE $PORT
 # Start the application
 CMD ["npm", "start"]
 """
-    
+
+def create_dockerfile(project_path: str, node_version: str = "18") -> bool:
+    """Create a Dockerfile for Railway deployment."""
     dockerfile_path = os.path.join(project_path, "Dockerfile")
+    changed = write_if_changed(dockerfile_path, render_dockerfile(node_version))
+    _report_write("Dockerfile", dockerfile_path, changed)
+    return changed
+
+def render_config_files(project_path: str, project_type: str) -> Dict[str, str]:
+    """Map each Railway config file name to the content it should have."""
+    if project_type == "node":
+        return {
+            "railway.json": render_railway_json(project_path, node_project=True),
+            "Procfile": render_procfile("npm start"),
+            "Dockerfile": render_dockerfile(),
+        }
+    return {
+        "railway.json": render_railway_json(project_path, node_project=False),
+        "Procfile": render_procfile("python main.py"),
+    }
+
+def detect_project_type(path: str) -> Optional[str]:
+    """Return 'node' or 'python' if the directory is a deployable package."""
+    package_json = os.path.join(path, "package.json")
+    if os.path.exists(package_json):
+        try:
+            with open(package_json, 'r') as f:
+                package_data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        # Workspace roots and libraries have nothing to start
+        if 'start' in package_data.get('scripts', {}) and 'workspaces' not in package_data:
+            return "node"
+        return None
+    
+    if os.path.exists(os.path.join(path, "requirements.txt")) or os.path.exists(os.path.join(path, "pyproject.toml")):
+        return "python"
+    return None
+
+def discover_packages(root: str) -> List[Tuple[str, str]]:
+    """Find every deployable package under root as (path, project_type)."""
+    packages = []
+    stack = [os.path.abspath(root)]
+    while stack:
+        path = stack.pop()
+        project_type = detect_project_type(path)
+        if project_type:
+            packages.append((path, project_type))
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS \
+                            and not entry.name.startswith('.'):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return sorted(packages)
+
+def process_package(path: str, project_type: str, check: bool = False, env_check: bool = True,
+                    exclude_dirs: Optional[Set[str]] = None, root: Optional[str] = None) -> Dict:
+    """Sync one package's config files; in check mode, only diff them.
+
+    Diff headers are relative to root (the batch root, or the package itself)
+    so they can be applied with `git apply` / `patch -p1` from there.
+    """
+    import difflib
+    
+    root = root or path
+    result = {'path': path, 'type': project_type, 'changed': [], 'diffs': [], 'issues': []}
+    
+    for name, content in render_config_files(path, project_type).items():
+        file_path = os.path.join(path, name)
+        if check:
+            current = _read_text(file_path)
+            if current != content:
+                result['changed'].append(name)
+                result['diffs'].append("".join(difflib.unified_diff(
+                    (current or "").splitlines(keepends=True), content.splitlines(keepends=True),
+                    fromfile=f"a/{Path(os.path.relpath(file_path, root)).as_posix()}",
+                    tofile=f"b/{Path(os.path.relpath(file_path, root)).as_posix()}"
+                )))
+        elif write_if_changed(file_path, content):
+            result['changed'].append(name)
+    
+    if env_check:
+        result['issues'] = check_environment_variables(path, exclude_dirs)
+    
+    return result
+
+def run_batch(root: str, check: bool = False, jobs: Optional[int] = None, env_check: bool = True) -> int:
+    """Process every deployable package under root in parallel.
+
+    Returns the number of packages whose files changed (or would change in check mode).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    packages = discover_packages(root)
+    if not packages:
+        print(f"⚠️  No deployable packages found under {root}")
+        return 0
+    
+    print(f"🔧 {'Checking' if check else 'Syncing'} Railway configuration for {len(packages)} packages")
+    
+    package_paths = [path for path, _ in packages]
+    
+    def nested_packages(path: str) -> Set[str]:
+        prefix = path + os.sep
+        return {other for other in package_paths if other.startswith(prefix)}
+    
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(process_package, path, project_type, check, env_check, nested_packages(path),
+                               os.path.abspath(root))
+                   for path, project_type in packages]
+        results = [future.result() for future in futures]
     
-    with open(dockerfile_path, 'w') as f:
-        f.write(dockerfile_content)
+    changed = 0
+    for result in results:
+        relative = os.path.relpath(result['path'], root)
+        if result['changed']:
+            changed += 1
+            verb = "would change" if check else "updated"
+            print(f"  ✏️  {relative} ({result['type']}): {verb} {', '.join(result['changed'])}")
+            for diff in result['diffs']:
+                print(diff, end="" if diff.endswith("\n") else "\n")
+        else:
+            print(f"  ✓  {relative} ({result['type']}): up to date")
+        for issue in result['issues']:
+            print(f"      • {issue}")
     
-    print(f"✅ Created Dockerfile at {dockerfile_path}")
+    print(f"\n📊 {changed}/{len(results)} packages {'out of date' if check else 'updated'}")
+    return changed
 
 def main():
     """Main function to set up Railway configuration."""
-    if len(sys.argv) < 2:
-        print("Usage: python railway_config_helper.py <project_path> [--node|--python]")
-        sys.exit(1)
-    
-    project_path = sys.argv[1]
-    project_type = "node"
+    parser = argparse.ArgumentParser(description='Create Railway configuration files')
+    parser.add_argument('project_path', help='Project directory (or monorepo root with --batch)')
+    project_group = parser.add_mutually_exclusive_group()
+    project_group.add_argument('--node', dest='project_type', action='store_const', const='node',
+                               help='Node.js project (default)')
+    project_group.add_argument('--python', dest='project_type', action='store_const', const='python',
+                               help='Python project')
+    parser.add_argument('--batch', action='store_true',
+                        help='Discover and process every deployable package under project_path')
+    parser.add_argument('--check', action='store_true',
+                        help='Show diffs without writing; exit 1 if any file would change')
+    parser.add_argument('--jobs', type=int, default=None, help='Parallel workers for --batch')
+    parser.add_argument('--no-env-check', action='store_true', help='Skip the environment variable scan')
+    parser.set_defaults(project_type='node')
     
-    if len(sys.argv) > 2:
-        if sys.argv[2] == "--python":
-            project_type = "python"
-        elif sys.argv[2] == "--node":
-            project_type = "node"
+    args = parser.parse_args()
+    project_path = args.project_path
+    project_type = args.project_type
     
     if not os.path.exists(project_path):
         print(f"❌ Project path does not exist: {project_path}")
         sys.exit(1)
     
+    if args.batch:
+        changed = run_batch(project_path, check=args.check, jobs=args.jobs, env_check=not args.no_env_check)
+        sys.exit(1 if args.check and changed else 0)
+    
+    if args.check:
+        result = process_package(os.path.abspath(project_path), project_type, check=True, env_check=False)
+        for diff in result['diffs']:
+            print(diff, end="" if diff.endswith("\n") else "\n")
+        if result['changed']:
+            print(f"✏️  Would change: {', '.join(result['changed'])}")
+            sys.exit(1)
+        print("✓  Railway configuration is up to date")
+        sys.exit(0)
+    
     print(f"🔧 Setting up Railway configuration for {project_type} project at {project_path}")
     
     # Create configuration files
@@ -162,15 +406,16 @@ def main():
         create_procfile(project_path, "python main.py")
     
     # Check for common issues
-    print("\n🔍 Checking for common issues...")
-    issues = check_environment_variables(project_path)
-    
-    if issues:
-        print("\n⚠️  Potential issues found:")
-        for issue in issues:
-            print(f"  • {issue}")
-    else:
-        print("✅ No obvious issues found")
+    if not args.no_env_check:
+        print("\n🔍 Checking for common issues...")
+        issues = check_environment_variables(project_path)
+        
+        if issues:
+            print("\n⚠️  Potential issues found:")
+            for issue in issues:
+                print(f"  • {issue}")
+        else:
+            print("✅ No obvious issues found")
     
     print("\n📋 Next steps:")
     print("1. Review the generated configuration files")
@@ -12,10 +12,9 @@ Usage:
 Requirements:
     - GitHub Personal Access Token
     - Railway CLI installed and authenticated (optional)
-    - Python packages: requests, subprocess, json, re, datetime
+    - Python packages: requests (only for GitHub API calls)
 """
 
-import requests
 import subprocess
 import json
 import re
@@ -25,11 +24,23 @@ from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 import argparse
 
+from build_log_analyzer import (
+    DEFAULT_BASELINE_FILE,
+    analyze_build_log,
+    format_build_analysis,
+    load_build_baselines,
+    save_build_baseline,
+)
+from runtime_signals import extract_runtime_signals, format_runtime_signals, parse_restart_policy
+
 class RailwayDeploymentAnalyzer:
-    def __init__(self, github_user: str, github_token: str, railway_token: Optional[str] = None):
+    def __init__(self, github_user: str, github_token: str, railway_token: Optional[str] = None,
+                 build_baseline_path: str = DEFAULT_BASELINE_FILE):
         self.github_user = github_user
         self.github_token = github_token
         self.railway_token = railway_token
+        self.build_baseline_path = build_baseline_path
+        self.build_baselines = load_build_baselines(build_baseline_path)
         
         self.gh_headers = {
             "Authorization": f"token {github_token}",
@@ -119,6 +130,9 @@ class RailwayDeploymentAnalyzer:
 
     def get_github_repos(self) -> List[Dict]:
         """Fetch all repositories for the GitHub user."""
+        # Imported here so local-only commands don't pay for requests at startup
+        import requests
+        
         print(f"🔍 Fetching repositories for user: {self.github_user}")
         
         repos = []
@@ -218,6 +232,58 @@ class RailwayDeploymentAnalyzer:
         except Exception as e:
             return f"Error running Railway CLI: {e}"
 
+    def get_railway_build_logs(self, project_name: str, service_name: str = 'default') -> str:
+        """Fetch Railway build logs using CLI."""
+        if not self.check_railway_cli():
+            return ""
+        
+        try:
+            cmd = ['railway', 'logs', '--build', '--project', project_name]
+            if service_name != 'default':
+                cmd.extend(['--service', service_name])
+            
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            
+            if result.returncode == 0:
+                return result.stdout
+            return ""
+                
+        except subprocess.TimeoutExpired:
+            print("⏰ Build log fetch timed out")
+        except Exception as e:
+            print(f"❌ Error running Railway CLI: {e}")
+        
+        return ""
+
+    def analyze_build_logs(self, build_logs: str, repo_name: str) -> Dict:
+        """Analyze build logs for per-step timings, cache misses and regressions."""
+        return analyze_build_log(build_logs, baseline=self.build_baselines.get(repo_name))
+
+    def get_repo_restart_policy(self, repo: Dict) -> Dict:
+        """Read restartPolicyType/MaxRetries from the repository's railway.json on GitHub."""
+        import requests
+        
+        full_name = repo.get('full_name', f"{self.github_user}/{repo['name']}")
+        url = f"https://api.github.com/repos/{full_name}/contents/railway.json"
+        headers = dict(self.gh_headers, Accept="application/vnd.github.v3.raw")
+        
+        try:
+            response = requests.get(url, headers=headers, timeout=30)
+            if response.status_code == 200:
+                return parse_restart_policy(response.text)
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️  Could not fetch railway.json for {full_name}: {e}")
+        
+        return {'type': None, 'max_retries': None}
+
+    def analyze_runtime_signals(self, logs: str, deployment: str = 'latest',
+                                restart_policy: Optional[Dict] = None) -> Dict:
+        """Extract heap, GC, OOM, latency, event-loop and restart signals from logs."""
+        restart_policy = restart_policy or {}
+        return extract_runtime_signals(logs, deployment=deployment,
+                                       max_retries=restart_policy.get('max_retries'),
+                                       restart_policy_type=restart_policy.get('type'))
+
     def analyze_logs(self, logs: str) -> Dict[str, List[str]]:
         """Analyze logs for common failure patterns."""
         findings = {}
@@ -307,6 +373,70 @@ class RailwayDeploymentAnalyzer:
         
         return recommendations
 
+    def generate_runtime_recommendations(self, runtime_signals: Dict) -> List[str]:
+        """Generate recommendations from quantitative runtime signals."""
+        recommendations = []
+        trending = {trend['metric'] for trend in runtime_signals['trends']}
+        
+        if trending & {'heap_used_mb', 'rss_mb'}:
+            recommendations.append("🔧 Investigate memory growth over the deploy")
+            recommendations.append("   - Steadily rising heap usage suggests a leak, not a one-off spike")
+            recommendations.append("   - Take heap snapshots before and after load to compare retained objects")
+        
+        if runtime_signals['oom_kills']:
+            recommendations.append(f"🔧 Process was OOM-killed {runtime_signals['oom_kills']} time(s)")
+            recommendations.append("   - Set --max-old-space-size below the container memory limit")
+        
+        if trending & {'request_ms', 'event_loop_lag_ms'}:
+            recommendations.append("🔧 Investigate growing request latency")
+            recommendations.append("   - Look for blocking work on the event loop and unbounded queries")
+        
+        if runtime_signals['restart_limit_reached']:
+            recommendations.append("🔧 Restart limit reached")
+            recommendations.append(f"   - {runtime_signals['restarts']} restarts exhausted restartPolicyMaxRetries "
+                                   f"({runtime_signals['max_retries']}); fix the crash instead of raising the limit")
+        
+        return recommendations
+
+    def generate_build_recommendations(self, build_analysis: Dict) -> List[str]:
+        """Generate recommendations for slow or regressed builds."""
+        recommendations = []
+        slow_phases = {slow['phase'] for slow in build_analysis['slow_phases']}
+        
+        if build_analysis['cache_misses']:
+            recommendations.append("🔧 Improve build cache reuse")
+            recommendations.append("   - Copy package*.json and install dependencies before copying sources")
+            recommendations.append("   - Avoid changing package-lock.json unless dependencies change")
+        
+        if 'npm_install' in slow_phases:
+            recommendations.append("🔧 Speed up dependency installation")
+            recommendations.append("   - Use npm ci with a committed package-lock.json")
+            recommendations.append("   - Move build-only packages to devDependencies and prune them")
+        
+        if 'vite_build' in slow_phases:
+            recommendations.append("🔧 Speed up the frontend build")
+            recommendations.append("   - Check for large dependencies pulled into the bundle")
+            recommendations.append("   - Disable sourcemaps in production builds if unused")
+        
+        if build_analysis['regressions']:
+            recommendations.append("🔧 Investigate build-time regression")
+            recommendations.append("   - Compare recent changes to Dockerfile, package.json and lockfile")
+        
+        return recommendations
+
+    def collect_performance_issues(self, runtime_signals: Dict, build_analysis: Dict) -> List[str]:
+        """List runtime and build problems that should mark a repository unhealthy."""
+        issues = []
+        if build_analysis['regressions']:
+            issues.append("build_time_regression")
+        if runtime_signals['oom_kills']:
+            issues.append("oom_kills")
+        if runtime_signals['trends']:
+            issues.append("runtime_trends")
+        if runtime_signals['restart_limit_reached']:
+            issues.append("restart_limit_reached")
+        return issues
+
     def analyze_repo(self, repo: Dict) -> Dict:
         """Analyze a single repository for deployment issues."""
         repo_name = repo['name']
@@ -323,14 +453,26 @@ class RailwayDeploymentAnalyzer:
         # Analyze logs for failure patterns
         findings = self.analyze_logs(logs)
         
+        # Extract quantitative runtime signals
+        runtime_signals = self.analyze_runtime_signals(logs, restart_policy=self.get_repo_restart_policy(repo))
+        
+        # Analyze build step timings
+        build_logs = self.get_railway_build_logs(repo_name)
+        build_analysis = self.analyze_build_logs(build_logs, repo_name)
+        
         # Generate recommendations
         recommendations = self.generate_recommendations(findings)
+        recommendations.extend(self.generate_runtime_recommendations(runtime_signals))
+        recommendations.extend(self.generate_build_recommendations(build_analysis))
+        
+        performance_issues = self.collect_performance_issues(runtime_signals, build_analysis)
         
         # Determine overall status
-        if not findings:
+        issue_count = len(findings) + len(performance_issues)
+        if not issue_count:
             status = "✅ No issues detected"
         else:
-            status = f"❌ {len(findings)} issue categories found"
+            status = f"❌ {issue_count} issue categories found"
         
         return {
             'repo_name': repo_name,
@@ -338,7 +480,10 @@ class RailwayDeploymentAnalyzer:
             'last_updated': last_updated,
             'status': status,
             'findings': findings,
+            'performance_issues': performance_issues,
             'recommendations': recommendations,
+            'runtime_signals': runtime_signals,
+            'build_analysis': build_analysis,
             'logs_preview': logs[:500] + "..." if len(logs) > 500 else logs
         }
 
@@ -355,7 +500,7 @@ class RailwayDeploymentAnalyzer:
         
         # Summary
         total_repos = len(analyses)
-        repos_with_issues = len([a for a in analyses if a['findings']])
+        repos_with_issues = len([a for a in analyses if a['findings'] or a['performance_issues']])
         repos_healthy = total_repos - repos_with_issues
         
         report.append("📊 SUMMARY")
@@ -382,14 +527,29 @@ class RailwayDeploymentAnalyzer:
                     for pattern in patterns:
                         report.append(f"    - {pattern}")
                 report.append("")
-                
+            if analysis['performance_issues']:
+                report.append("🔍 PERFORMANCE ISSUES FOUND:")
+                for issue in analysis['performance_issues']:
+                    report.append(f"  • {issue.replace('_', ' ').title()}")
+                report.append("")
+            if not analysis['findings'] and not analysis['performance_issues']:
+                report.append("✅ No deployment issues detected")
+                report.append("")
+            
+            runtime_lines = format_runtime_signals(analysis['runtime_signals'])
+            if runtime_lines:
+                report.extend(runtime_lines)
+                report.append("")
+            
+            if analysis['build_analysis']['steps']:
+                report.extend(format_build_analysis(analysis['build_analysis']))
+                report.append("")
+            
+            if analysis['recommendations']:
                 report.append("💡 RECOMMENDATIONS:")
                 for rec in analysis['recommendations']:
                     report.append(f"  {rec}")
                 report.append("")
-            else:
-                report.append("✅ No deployment issues detected")
-                report.append("")
             
             if analysis['logs_preview']:
                 report.append("📋 LOGS PREVIEW:")
@@ -399,7 +559,7 @@ class RailwayDeploymentAnalyzer:
         
         return "\n".join(report)
 
-    def run_analysis(self, limit: Optional[int] = None) -> None:
+    def run_analysis(self, limit: Optional[int] = None, update_build_baseline: bool = False) -> None:
         """Run the complete analysis."""
         print("🚀 Starting Railway Deployment Analysis")
         print("=" * 50)
@@ -428,7 +588,17 @@ class RailwayDeploymentAnalyzer:
         with open(report_filename, 'w') as f:
             f.write(report)
         
+        json_filename = f"railway_deployment_report_{timestamp}.json"
+        with open(json_filename, 'w') as f:
+            json.dump(analyses, f, indent=2)
+        
+        if update_build_baseline:
+            for analysis in analyses:
+                save_build_baseline(self.build_baseline_path, analysis['repo_name'], analysis['build_analysis'])
+            print(f"📏 Build baselines updated in {self.build_baseline_path}")
+        
         print(f"\n📄 Report saved to: {report_filename}")
+        print(f"📄 Structured results saved to: {json_filename}")
         print("\n" + "=" * 80)
         print("ANALYSIS COMPLETE")
         print("=" * 80)
@@ -440,6 +610,8 @@ def main():
     parser.add_argument('--github-token', help='GitHub Personal Access Token (will prompt if not provided)')
     parser.add_argument('--railway-token', help='Railway API token (optional)')
     parser.add_argument('--limit', type=int, help='Limit analysis to first N repositories')
+    parser.add_argument('--build-baseline', default=DEFAULT_BASELINE_FILE, help='Build timing baseline file')
+    parser.add_argument('--update-build-baseline', action='store_true', help='Store analyzed build timings as the new baseline')
     
     args = parser.parse_args()
     
@@ -456,11 +628,12 @@ def main():
     analyzer = RailwayDeploymentAnalyzer(
         github_user=args.github_user,
         github_token=github_token,
-        railway_token=args.railway_token
+        railway_token=args.railway_token,
+        build_baseline_path=args.build_baseline
     )
     
     try:
-        analyzer.run_analysis(limit=args.limit)
+        analyzer.run_analysis(limit=args.limit, update_build_baseline=args.update_build_baseline)
     except KeyboardInterrupt:
         print("\n\n⏹️  Analysis interrupted by user")
     except Exception as e:
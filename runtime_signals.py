@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Runtime Performance Signal Extractor
+====================================
+
+Pulls numeric runtime signals out of deployment logs — heap and RSS figures,
+GC pauses, OOM kills, request durations, event-loop lag and container
+restarts — and aggregates them into per-deployment time series, percentiles
+and trends, so a report can say "p95 request time grew from 120ms to 900ms"
+rather than just "timeout found".
+
+Usage:
+    python3 runtime_signals.py deploy.log
+    python3 runtime_signals.py deploy.log --railway-json railway.json --json
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from typing import Dict, List, Optional
+
+# Matches railway_config_helper.create_railway_json
+DEFAULT_RESTART_POLICY = 'ON_FAILURE'
+DEFAULT_MAX_RETRIES = 10
+
+# Minimum samples before a metric is checked for a trend, and the growth
+# factor (last third vs first third of the deploy) that counts as one
+MIN_TREND_SAMPLES = 6
+TREND_GROWTH_FACTOR = 1.5
+
+# metric -> (label, unit, statistic compared for trends)
+METRICS = {
+    'request_ms': ('request time', 'ms', 'p95'),
+    'heap_used_mb': ('heap used', 'MB', 'p50'),
+    'rss_mb': ('RSS', 'MB', 'p50'),
+    'gc_pause_ms': ('GC pause', 'ms', 'p95'),
+    'event_loop_lag_ms': ('event loop lag', 'ms', 'p95'),
+}
+
+TIMESTAMP_RE = re.compile(
+    r'^\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\]?\s*'
+)
+TRACE_GC_RE = re.compile(
+    r'(Scavenge|Mark-sweep|Mark-Compact|Mark-compact)\S*\s+([\d.]+)\s*\(([\d.]+)\)\s*->\s*'
+    r'([\d.]+)\s*\(([\d.]+)\)\s*MB,\s*([\d.]+)\s*/\s*([\d.]+)\s*ms'
+)
+HEAP_USED_RE = re.compile(r'heap[ _]?used["\']?\s*[:=]\s*([\d.]+)\s*(B|KB|kB|MB|GB)?\b', re.IGNORECASE)
+RSS_RE = re.compile(r'\brss["\']?\s*[:=]\s*([\d.]+)\s*(B|KB|kB|MB|GB)?\b', re.IGNORECASE)
+GC_PAUSE_RE = re.compile(r'gc[ _]?pause["\']?\s*[:=]?\s*([\d.]+)\s*(ms|s)\b', re.IGNORECASE)
+REQUEST_RE = re.compile(r'\b(?:GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+\S+\s+\d{3}\s+([\d.]+)\s*(ms|s)\b')
+DURATION_RE = re.compile(
+    r'\b(?:duration|response[ _]time|latency|took)["\']?\s*[:=]?\s*([\d.]+)\s*(ms|s)\b', re.IGNORECASE
+)
+EVENT_LOOP_RE = re.compile(
+    r'(?:event[ _-]?loop[^\d\n]{0,30}?|blocked for\s+)([\d.]+)\s*(ms|s)\b', re.IGNORECASE
+)
+# Generic duration fields only count as request time on lines that look like a request
+REQUEST_MARKER_RE = re.compile(
+    r'\b(?:GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\b|(?:^|\s)/[\w./-]*|\breq(?:uest)?\b', re.IGNORECASE
+)
+OOM_RE = re.compile(
+    r'JavaScript heap out of memory|OOMKilled|Out of memory: Killed process',
+    re.IGNORECASE
+)
+# A SIGKILL / exit 137 is usually the tail of an OOM already logged above
+KILL_RE = re.compile(r'exit(?:ed)?(?: with)? code:? 137|signal:? SIGKILL', re.IGNORECASE)
+CONTAINER_START_RE = re.compile(r'Starting Container', re.IGNORECASE)
+RESTART_RE = re.compile(r'\b(?:restarting|restarted)\b(?: (?:container|process|service|app))?', re.IGNORECASE)
+
+MEMORY_UNITS = {'B': 1 / (1024 * 1024), 'KB': 1 / 1024, 'MB': 1, 'GB': 1024}
+
+
+def _to_mb(value: float, unit: Optional[str]) -> float:
+    if unit:
+        return value * MEMORY_UNITS[unit.upper()]
+    # process.memoryUsage() prints raw bytes
+    return value / (1024 * 1024) if value >= 1024 * 1024 else value
+
+
+def _to_ms(value: float, unit: str) -> float:
+    return value * 1000 if unit == 's' else value
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize_series(values: List[float]) -> Dict:
+    """Summarize a series with count, range and percentiles, plus the
+    percentiles of its first and last thirds for trend comparison."""
+    summary = {
+        'count': len(values),
+        'min': min(values) if values else None,
+        'max': max(values) if values else None,
+    }
+    for pct in (50, 95, 99):
+        summary[f'p{pct}'] = percentile(values, pct)
+
+    if len(values) >= MIN_TREND_SAMPLES:
+        third = len(values) // 3
+        for part, chunk in (('first', values[:third]), ('last', values[-third:])):
+            for pct in (50, 95):
+                summary[f'{part}_p{pct}'] = percentile(chunk, pct)
+
+    return summary
+
+
+def restart_limit_reached(restarts: int, policy_type: str, max_retries: int) -> bool:
+    """True when an ON_FAILURE policy has used up its retries.
+
+    ALWAYS restarts without a limit and NEVER does not restart, so the retry
+    count only applies to ON_FAILURE.
+    """
+    return policy_type == 'ON_FAILURE' and restarts > 0 and restarts >= max_retries
+
+
+def extract_runtime_signals(logs: str, deployment: str = 'latest',
+                            max_retries: Optional[int] = None,
+                            restart_policy_type: Optional[str] = None) -> Dict:
+    """Extract numeric runtime signals from one deployment's logs.
+
+    max_retries and restart_policy_type are the project's restartPolicyMaxRetries
+    and restartPolicyType; when unknown the Railway defaults are assumed and
+    flagged as such in the result.
+    """
+    series: Dict[str, List[Dict]] = {metric: [] for metric in METRICS}
+    oom_kills = 0
+    oom_since_start = False
+    container_starts = 0
+    restart_lines = 0
+
+    def record(metric: str, line_no: int, timestamp: Optional[str], value: float) -> None:
+        series[metric].append({'line': line_no, 'time': timestamp, 'value': round(value, 2)})
+
+    for line_no, raw_line in enumerate(logs.splitlines(), 1):
+        line = raw_line.strip()
+        timestamp = None
+        match = TIMESTAMP_RE.match(line)
+        if match:
+            timestamp = match.group(1)
+            line = line[match.end():]
+
+        gc = TRACE_GC_RE.search(line)
+        if gc:
+            record('heap_used_mb', line_no, timestamp, float(gc.group(4)))
+            record('gc_pause_ms', line_no, timestamp, float(gc.group(6)))
+        else:
+            heap = HEAP_USED_RE.search(line)
+            if heap:
+                record('heap_used_mb', line_no, timestamp, _to_mb(float(heap.group(1)), heap.group(2)))
+            pause = GC_PAUSE_RE.search(line)
+            if pause:
+                record('gc_pause_ms', line_no, timestamp, _to_ms(float(pause.group(1)), pause.group(2).lower()))
+
+        rss = RSS_RE.search(line)
+        if rss:
+            record('rss_mb', line_no, timestamp, _to_mb(float(rss.group(1)), rss.group(2)))
+
+        request = REQUEST_RE.search(line)
+        if not request and REQUEST_MARKER_RE.search(line):
+            request = DURATION_RE.search(line)
+        if request:
+            record('request_ms', line_no, timestamp, _to_ms(float(request.group(1)), request.group(2).lower()))
+
+        lag = EVENT_LOOP_RE.search(line)
+        if lag:
+            record('event_loop_lag_ms', line_no, timestamp, _to_ms(float(lag.group(1)), lag.group(2).lower()))
+
+        # Count each crash once: the heap error, OOMKilled and exit 137 lines of
+        # one crash all fall between two container starts
+        if (OOM_RE.search(line) or KILL_RE.search(line)) and not oom_since_start:
+            oom_kills += 1
+            oom_since_start = True
+        if CONTAINER_START_RE.search(line):
+            container_starts += 1
+            oom_since_start = False
+        elif RESTART_RE.search(line):
+            restart_lines += 1
+
+    # Every container start after the first is a restart; fall back to explicit
+    # restart messages when the platform's start markers are not in the logs
+    restarts = container_starts - 1 if container_starts > 1 else restart_lines
+
+    stats = {
+        metric: summarize_series([point['value'] for point in points])
+        for metric, points in series.items() if points
+    }
+
+    assumed = max_retries is None or restart_policy_type is None
+    policy_type = (restart_policy_type or DEFAULT_RESTART_POLICY).upper()
+    max_retries = max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
+
+    return {
+        'deployment': deployment,
+        'series': {metric: points for metric, points in series.items() if points},
+        'stats': stats,
+        'oom_kills': oom_kills,
+        'restarts': restarts,
+        'restart_policy_type': policy_type,
+        'max_retries': max_retries,
+        'restart_policy_assumed': assumed,
+        'restart_limit_reached': restart_limit_reached(restarts, policy_type, max_retries),
+        'trends': detect_trends(stats),
+    }
+
+
+def detect_trends(stats: Dict[str, Dict]) -> List[Dict]:
+    """Find metrics whose level grew significantly over the deploy."""
+    trends = []
+    for metric, summary in stats.items():
+        label, unit, statistic = METRICS[metric]
+        first = summary.get(f'first_{statistic}')
+        last = summary.get(f'last_{statistic}')
+        if first is None or last is None:
+            continue
+        if last > first * TREND_GROWTH_FACTOR:
+            trends.append({
+                'metric': metric,
+                'statistic': statistic,
+                'first': first,
+                'last': last,
+                'message': f"{statistic} {label} grew from {first:g}{unit} to {last:g}{unit} over this deploy",
+            })
+    return trends
+
+
+def parse_restart_policy(railway_json: str) -> Dict:
+    """Extract restartPolicyType and restartPolicyMaxRetries from railway.json content.
+
+    Unset or unreadable values are returned as None.
+    """
+    policy = {'type': None, 'max_retries': None}
+    try:
+        deploy = json.loads(railway_json).get('deploy', {})
+        policy['type'] = deploy.get('restartPolicyType')
+        value = deploy.get('restartPolicyMaxRetries')
+        policy['max_retries'] = int(value) if value is not None else None
+    except (ValueError, TypeError, AttributeError):
+        pass
+    return policy
+
+
+def load_restart_policy(railway_json_path: str) -> Dict:
+    """Read the restart policy from a railway.json file, if present."""
+    try:
+        with open(railway_json_path, 'r') as f:
+            return parse_restart_policy(f.read())
+    except OSError:
+        return {'type': None, 'max_retries': None}
+
+
+def format_runtime_signals(signals: Dict) -> List[str]:
+    """Render extracted runtime signals as report lines."""
+    lines = []
+    if not signals['stats'] and not signals['oom_kills'] and not signals['restarts']:
+        return lines
+
+    lines.append(f"📈 RUNTIME SIGNALS ({signals['deployment']} deployment)")
+    for metric, summary in signals['stats'].items():
+        label, unit, _ = METRICS[metric]
+        lines.append(f"  • {label[0].upper()}{label[1:]}: n={summary['count']} "
+                     f"p50={summary['p50']:g}{unit} p95={summary['p95']:g}{unit} "
+                     f"p99={summary['p99']:g}{unit} max={summary['max']:g}{unit}")
+
+    if signals['oom_kills']:
+        lines.append(f"  ⚠️  OOM kills: {signals['oom_kills']}")
+    if signals['restarts']:
+        marker = "⚠️ " if signals['restart_limit_reached'] else "ℹ️ "
+        assumed = ", assumed default" if signals['restart_policy_assumed'] else ""
+        if signals['restart_policy_type'] == 'ON_FAILURE':
+            policy = f"ON_FAILURE, restartPolicyMaxRetries {signals['max_retries']}"
+        else:
+            policy = signals['restart_policy_type']
+        lines.append(f"  {marker} Restarts: {signals['restarts']} (restartPolicyType {policy}{assumed})")
+    for trend in signals['trends']:
+        lines.append(f"  📈 {trend['message']}")
+
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract runtime performance signals from deployment logs')
+    parser.add_argument('log_file', help='Path to the deployment log ("-" for stdin)')
+    parser.add_argument('--deployment', default='latest', help='Deployment name shown in the report')
+    parser.add_argument('--railway-json', help='railway.json to read the restart policy from')
+    parser.add_argument('--json', action='store_true', help='Print the signals as JSON')
+
+    args = parser.parse_args()
+
+    if args.log_file == '-':
+        logs = sys.stdin.read()
+    else:
+        if not os.path.exists(args.log_file):
+            print(f"❌ Log file does not exist: {args.log_file}")
+            sys.exit(1)
+        with open(args.log_file, 'r', encoding='utf-8', errors='replace') as f:
+            logs = f.read()
+
+    policy = load_restart_policy(args.railway_json) if args.railway_json else {'type': None, 'max_retries': None}
+    signals = extract_runtime_signals(logs, deployment=args.deployment, max_retries=policy['max_retries'],
+                                      restart_policy_type=policy['type'])
+
+    if args.json:
+        print(json.dumps(signals, indent=2))
+    else:
+        lines = format_runtime_signals(signals)
+        print("\n".join(lines) if lines else "✅ No runtime performance signals found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Express/SQLite Performance Anti-Pattern Checker
+===============================================
+
+Statically scans the server sources for patterns that hurt under load:
+unbounded list queries in request handlers, SQLite opened without WAL or a
+busy timeout, WHERE columns without an index, synchronous fs calls in request
+handlers, missing compression / static caching, and cron jobs that run
+full-table scans. Every finding points to a file and line.
+
+Usage:
+    python3 server_perf_checker.py [project_path]
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+SERVER_FILES = ['server/index.js', 'server/database.js', 'server/automations.js']
+
+ROUTE_RE = re.compile(r'\b(?:app|router)\.(?:get|post|put|patch|delete|all)\s*\(')
+CRON_RE = re.compile(r'\bcron\.schedule\s*\(')
+FUNCTION_RE = re.compile(r'\bfunction\s+(\w+)\s*\([^)]*\)\s*\{|\bconst\s+(\w+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>\s*\{')
+CALL_RE = re.compile(r'\b(\w+)\s*\(')
+STRING_RE = re.compile(r'`[^`]*`|\'[^\'\n]*\'|"[^"\n]*"')
+SQL_RE = re.compile(r'^\s*(SELECT|UPDATE|DELETE|INSERT)\b', re.IGNORECASE)
+SELECT_STAR_RE = re.compile(r'\bSELECT\s+\*\s+FROM\b', re.IGNORECASE)
+AGGREGATE_RE = re.compile(r'\b(COUNT|SUM|AVG|MIN|MAX)\s*\(', re.IGNORECASE)
+TABLE_RE = re.compile(r'\b(?:FROM|UPDATE|INTO)\s+(\$\{\w+\}|\w+)', re.IGNORECASE)
+WHERE_RE = re.compile(r'\bWHERE\b(.*?)(?:\bORDER\s+BY\b|\bGROUP\s+BY\b|\bLIMIT\b|$)', re.IGNORECASE | re.DOTALL)
+CONDITION_RE = re.compile(r'(\$\{\w+\}|\w+)\s*(?:=|<|>|!=|<>|\bIN\b|\bLIKE\b|\bIS\b)', re.IGNORECASE)
+ORDER_LIMIT_RE = re.compile(r'\bORDER\s+BY\s+(\w+)[^`]*\bLIMIT\b', re.IGNORECASE | re.DOTALL)
+SYNC_CALL_RE = re.compile(r'\b(?:fs\.)?(\w+Sync)\s*\(')
+CREATE_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\((.*?)\)\s*`', re.IGNORECASE | re.DOTALL)
+CREATE_INDEX_RE = re.compile(r'CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?\w+\s+ON\s+(\w+)\s*\(\s*(\w+)',
+                             re.IGNORECASE)
+KEYED_COLUMN_RE = re.compile(r'^\s*(\w+)\s+\w+.*\b(PRIMARY\s+KEY|UNIQUE)\b', re.IGNORECASE | re.MULTILINE)
+SQLITE_OPEN_RE = re.compile(r'new\s+(?:sqlite3\.)?Database\s*\(|require\([\'"]better-sqlite3[\'"]\)')
+EXPRESS_APP_RE = re.compile(r'=\s*express\s*\(\s*\)')
+STATIC_RE = re.compile(r'express\.static\s*\(([^)]*)\)')
+
+
+def _line_of(content: str, index: int) -> int:
+    return content.count('\n', 0, index) + 1
+
+
+def _mask_comments(content: str) -> str:
+    """Blank out // and /* */ comments, keeping offsets and newlines intact.
+
+    An apostrophe in a comment (`// don't cache`) would otherwise open a string
+    that runs to the end of the file for the bracket and SQL matchers below.
+    """
+    masked = []
+    quote: Optional[str] = None
+    i = 0
+    while i < len(content):
+        char = content[i]
+        if quote:
+            masked.append(char)
+            if char == '\\' and i + 1 < len(content):
+                masked.append(content[i + 1])
+                i += 1
+            elif char == quote or (char == '\n' and quote != '`'):
+                quote = None
+            i += 1
+        elif char in '\'"`':
+            quote = char
+            masked.append(char)
+            i += 1
+        elif content.startswith('//', i):
+            end = content.find('\n', i)
+            end = len(content) if end == -1 else end
+            masked.append(' ' * (end - i))
+            i = end
+        elif content.startswith('/*', i):
+            end = content.find('*/', i + 2)
+            end = len(content) if end == -1 else end + 2
+            masked.append(re.sub(r'[^\n]', ' ', content[i:end]))
+            i = end
+        else:
+            masked.append(char)
+            i += 1
+    return ''.join(masked)
+
+
+def _block_end(content: str, open_index: int) -> int:
+    """Index just past the bracket matching the one at open_index, skipping strings.
+
+    Expects content with comments already blanked by _mask_comments.
+    """
+    pairs = {'(': ')', '{': '}'}
+    opener = content[open_index]
+    closer = pairs[opener]
+    depth = 0
+    i = open_index
+    quote: Optional[str] = None
+    while i < len(content):
+        char = content[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '\'"`':
+            quote = char
+        elif char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(content)
+
+
+def _blocks(content: str, pattern: re.Pattern) -> List[Tuple[int, int]]:
+    """(start, end) spans of the call expressions matched by pattern."""
+    return [(m.start(), _block_end(content, m.end() - 1)) for m in pattern.finditer(content)]
+
+
+def _function_bodies(content: str) -> Dict[str, Tuple[int, int]]:
+    bodies = {}
+    for match in FUNCTION_RE.finditer(content):
+        name = match.group(1) or match.group(2)
+        bodies[name] = (match.start(), _block_end(content, match.end() - 1))
+    return bodies
+
+
+def _sql_strings(content: str, start: int = 0, end: Optional[int] = None) -> List[Tuple[int, str]]:
+    """(offset, sql) for every string literal in the span that looks like SQL.
+
+    Expects content with comments already blanked by _mask_comments.
+    """
+    end = len(content) if end is None else end
+    found = []
+    for match in STRING_RE.finditer(content, start, end):
+        literal = match.group(0)[1:-1]
+        if SQL_RE.match(literal):
+            found.append((match.start(), literal))
+    return found
+
+
+def _is_unbounded_select(sql: str) -> bool:
+    return (sql.lstrip().upper().startswith('SELECT')
+            and not re.search(r'\bLIMIT\b', sql, re.IGNORECASE)
+            and not re.search(r'\bWHERE\b', sql, re.IGNORECASE)
+            and not AGGREGATE_RE.search(sql))
+
+
+def _finding(check: str, file: str, line: int, message: str) -> Dict:
+    return {'check': check, 'file': file, 'line': line, 'message': message}
+
+
+def load_schema(sources: Dict[str, str]) -> Dict[str, Set[str]]:
+    """Map each table to the columns usable as an index (PK, UNIQUE, CREATE INDEX)."""
+    indexed: Dict[str, Set[str]] = {}
+    for content in sources.values():
+        for match in CREATE_TABLE_RE.finditer(content):
+            table = match.group(1)
+            indexed.setdefault(table, {'rowid'})
+            indexed[table].update(col.group(1) for col in KEYED_COLUMN_RE.finditer(match.group(2)))
+        for match in CREATE_INDEX_RE.finditer(content):
+            indexed.setdefault(match.group(1), {'rowid'}).add(match.group(2))
+    return indexed
+
+
+def check_unbounded_selects(file: str, content: str) -> List[Dict]:
+    findings = []
+    for start, end in _blocks(content, ROUTE_RE):
+        handler = content[start:end]
+        if re.search(r'req\.query\.(limit|offset|page|cursor)', handler):
+            continue
+        for offset, sql in _sql_strings(content, start, end):
+            if SELECT_STAR_RE.search(sql) and _is_unbounded_select(sql):
+                findings.append(_finding(
+                    'unbounded_select', file, _line_of(content, offset),
+                    "List endpoint runs SELECT * with no LIMIT/pagination; add ?limit=&offset= with a capped default"
+                ))
+    return findings
+
+
+def check_sqlite_config(file: str, content: str) -> List[Dict]:
+    match = SQLITE_OPEN_RE.search(content)
+    if not match:
+        return []
+    findings = []
+    line = _line_of(content, match.start())
+    if not re.search(r'journal_mode\s*=\s*WAL', content, re.IGNORECASE):
+        findings.append(_finding(
+            'sqlite_wal', file, line,
+            "SQLite opened without WAL; run PRAGMA journal_mode = WAL so reads don't block on writes"
+        ))
+    if not re.search(r'busy_timeout|busyTimeout', content):
+        findings.append(_finding(
+            'sqlite_busy_timeout', file, line,
+            "SQLite opened without a busy timeout; concurrent writes fail with SQLITE_BUSY "
+            "(db.configure('busyTimeout', 5000))"
+        ))
+    return findings
+
+
+def check_missing_indexes(file: str, content: str, indexed: Dict[str, Set[str]]) -> List[Dict]:
+    findings = []
+    for offset, sql in _sql_strings(content):
+        table_match = TABLE_RE.search(sql)
+        where = WHERE_RE.search(sql)
+        if not table_match or not where or table_match.group(1).startswith('${'):
+            continue
+        table = table_match.group(1)
+        if table not in indexed:
+            continue
+        columns = [c.group(1) for c in CONDITION_RE.finditer(where.group(1)) if not c.group(1).startswith('${')]
+        missing = [c for c in dict.fromkeys(columns) if c not in indexed[table]]
+        if missing and not any(c in indexed[table] for c in columns):
+            findings.append(_finding(
+                'missing_index', file, _line_of(content, offset),
+                f"WHERE on {table}({', '.join(missing)}) has no index; "
+                f"CREATE INDEX idx_{table}_{'_'.join(missing)} ON {table}({', '.join(missing)})"
+            ))
+
+    # ORDER BY ... LIMIT on an unindexed column still scans and sorts the whole table
+    for offset, sql in _sql_strings(content):
+        table_match = TABLE_RE.search(sql)
+        order = ORDER_LIMIT_RE.search(sql)
+        if not table_match or not order or WHERE_RE.search(sql):
+            continue
+        table, column = table_match.group(1), order.group(1)
+        if table in indexed and column not in indexed[table]:
+            findings.append(_finding(
+                'missing_index', file, _line_of(content, offset),
+                f"ORDER BY {table}({column}) with LIMIT sorts the whole table; "
+                f"CREATE INDEX idx_{table}_{column} ON {table}({column})"
+            ))
+    return findings
+
+
+def check_sync_fs_in_handlers(file: str, content: str) -> List[Dict]:
+    findings = []
+    for start, end in _blocks(content, ROUTE_RE):
+        for match in SYNC_CALL_RE.finditer(content, start, end):
+            findings.append(_finding(
+                'sync_fs', file, _line_of(content, match.start()),
+                f"{match.group(1)} blocks the event loop inside a request handler; use the async/promises API"
+            ))
+    return findings
+
+
+def check_http_caching(file: str, content: str) -> List[Dict]:
+    findings = []
+    app = EXPRESS_APP_RE.search(content)
+    if app and 'compression' not in content:
+        findings.append(_finding(
+            'compression', file, _line_of(content, app.start()),
+            "No response compression; add app.use(compression()) before the routes"
+        ))
+    for match in STATIC_RE.finditer(content):
+        if not re.search(r'maxAge|immutable|setHeaders', match.group(1)):
+            findings.append(_finding(
+                'static_cache', file, _line_of(content, match.start()),
+                "express.static without caching headers; pass { maxAge: '1y', immutable: true } for hashed assets"
+            ))
+    return findings
+
+
+def check_cron_scans(file: str, content: str) -> List[Dict]:
+    """Flag full-table scans run from cron jobs, following one level of local calls."""
+    findings = []
+    functions = _function_bodies(content)
+    for start, end in _blocks(content, CRON_RE):
+        spans = [(start, end)]
+        spans += [functions[name] for name in {m.group(1) for m in CALL_RE.finditer(content, start, end)}
+                  if name in functions]
+        for span_start, span_end in spans:
+            for offset, sql in _sql_strings(content, span_start, span_end):
+                if _is_unbounded_select(sql) or (sql.lstrip().upper().startswith(('UPDATE', 'DELETE'))
+                                                 and not re.search(r'\bWHERE\b', sql, re.IGNORECASE)):
+                    findings.append(_finding(
+                        'cron_full_scan', file, _line_of(content, offset),
+                        f"Scheduled job (line {_line_of(content, start)}) runs a full-table scan; "
+                        "filter on an indexed column or process in batches"
+                    ))
+    return findings
+
+
+def check_server_performance(project_root: Path, files: Optional[List[str]] = None) -> List[Dict]:
+    """Run every check over the server sources and return findings sorted by location."""
+    sources = {}
+    for relative in files or SERVER_FILES:
+        path = project_root / relative
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                sources[relative] = _mask_comments(f.read())
+
+    indexed = load_schema(sources)
+    findings = []
+    for file, content in sources.items():
+        findings.extend(check_unbounded_selects(file, content))
+        findings.extend(check_sqlite_config(file, content))
+        findings.extend(check_missing_indexes(file, content, indexed))
+        findings.extend(check_sync_fs_in_handlers(file, content))
+        findings.extend(check_http_caching(file, content))
+        findings.extend(check_cron_scans(file, content))
+
+    return sorted(findings, key=lambda f: (f['file'], f['line'], f['check']))
+
+
+def format_finding(finding: Dict) -> str:
+    return f"{finding['file']}:{finding['line']}: {finding['message']}"
+
+
+def main():
+    project_root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
+    findings = check_server_performance(project_root)
+
+    if not findings:
+        print("✅ No server performance anti-patterns found")
+        sys.exit(0)
+
+    print(f"⚡ Server performance findings ({len(findings)}):")
+    for finding in findings:
+        print(f"   {format_finding(finding)}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,7 @@ fi
 # Make scripts executable
 chmod +x railway_deployment_analyzer.py
 chmod +x railway_config_helper.py
+chmod +x codex.py
 chmod +x test_analyzer.py
 
 echo ""
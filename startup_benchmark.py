@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+=====================
+
+Runs codex subcommands under `python -X importtime` and sums the import time
+they add on top of a bare interpreter. Fails when any command exceeds the
+startup budget, when a local-only command imports a network dependency, or
+when a run crashes (a traceback or an unexpected exit code).
+
+Usage:
+    python3 startup_benchmark.py [--budget-ms 50] [--runs 5]
+    python3 codex.py bench-startup
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Set
+
+DEFAULT_BUDGET_MS = 50.0
+DEFAULT_RUNS = 5
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+CODEX = os.path.join(PROJECT_ROOT, "codex.py")
+
+# Commands measured, run from the project root. Local checks only read files.
+BENCHMARKS = [
+    ['--help'],
+    ['check', PROJECT_ROOT],
+    ['config', PROJECT_ROOT, '--check', '--no-env-check'],
+    ['perf', PROJECT_ROOT],
+]
+
+# Modules local commands must not import
+FORBIDDEN_MODULES = {'requests', 'urllib3', 'ssl'}
+
+# Checks exit 1 when they find problems; anything else (or a traceback) means
+# the command crashed and its import time can't be trusted
+EXPECTED_RETURN_CODES = {0, 1}
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Map module name -> self import time (µs) from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, _, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = int(self_us)
+        except ValueError:
+            continue
+    return modules
+
+
+def interpreter_modules() -> Set[str]:
+    """Modules a bare interpreter imports anyway; not counted against the CLI."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'],
+                            capture_output=True, text=True)
+    return set(parse_importtime(result.stderr))
+
+
+def run_error(returncode: int, stderr: str) -> Optional[str]:
+    """Describe a crashed run, or None if the command exited normally."""
+    if 'Traceback (most recent call last)' in stderr:
+        last_line = [line for line in stderr.splitlines() if line and not line.startswith('import time:')][-1]
+        return f"traceback: {last_line.strip()}"
+    if returncode not in EXPECTED_RETURN_CODES:
+        return f"exit code {returncode}"
+    return None
+
+
+def measure(args: List[str], baseline: Set[str]) -> Dict:
+    """Import time (ms) added by one codex invocation, and the modules it loaded."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', CODEX] + args,
+                            capture_output=True, text=True, cwd=PROJECT_ROOT)
+    modules = parse_importtime(result.stderr)
+    added = {name: us for name, us in modules.items() if name not in baseline}
+    return {
+        'import_ms': sum(added.values()) / 1000,
+        'modules': set(added),
+        'error': run_error(result.returncode, result.stderr),
+    }
+
+
+def run_benchmarks(budget_ms: float = DEFAULT_BUDGET_MS, runs: int = DEFAULT_RUNS) -> List[Dict]:
+    baseline = interpreter_modules()
+    results = []
+    for args in BENCHMARKS:
+        # First run warms the filesystem and bytecode caches
+        measure(args, baseline)
+        samples = [measure(args, baseline) for _ in range(runs)]
+        median_ms = statistics.median(sample['import_ms'] for sample in samples)
+        forbidden = sorted(set().union(*(s['modules'] for s in samples)) & FORBIDDEN_MODULES)
+        errors = sorted({sample['error'] for sample in samples if sample['error']})
+        results.append({
+            'command': ' '.join(os.path.relpath(a, PROJECT_ROOT) if a == PROJECT_ROOT else a for a in args),
+            'median_ms': round(median_ms, 1),
+            'max_ms': round(max(sample['import_ms'] for sample in samples), 1),
+            'forbidden': forbidden,
+            'errors': errors,
+            'ok': median_ms <= budget_ms and not forbidden and not errors,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check codex CLI import time against a startup budget')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='Import time budget per command')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='Measured runs per command')
+    args = parser.parse_args()
+
+    print(f"⏱️  Startup import time (median of {args.runs} runs, budget {args.budget_ms:.0f}ms)")
+    results = run_benchmarks(args.budget_ms, args.runs)
+
+    for result in results:
+        status = "✅" if result['ok'] else "❌"
+        line = f"   {status} {result['median_ms']:>6.1f}ms (max {result['max_ms']:.1f}ms)  codex {result['command']}"
+        if result['forbidden']:
+            line += f"  [imports {', '.join(result['forbidden'])}]"
+        if result['errors']:
+            line += f"  [crashed: {'; '.join(result['errors'])}]"
+        print(line)
+
+    sys.exit(0 if all(result['ok'] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from build_log_analyzer import classify_step, parse_build_steps
+
+BUILDKIT_LOG = """\
+#1 [internal] load build definition from Dockerfile
+#1 DONE 0.1s
+#5 [2/5] WORKDIR /app
+#5 CACHED
+#6 [3/5] COPY package*.json ./
+#6 DONE 0.2s
+#7 [4/5] RUN npm ci
+#7 12.30 added 500 packages
+#7 DONE 45.2s
+#8 [5/5] RUN yarn build
+#8 3.100 vite v5.0.8 building for production...
+#8 ERROR: process "/bin/sh -c yarn build" did not complete successfully
+"""
+
+LEGACY_LOG = """\
+2024-01-01T10:00:00Z Step 1/4 : FROM node:18-alpine
+2024-01-01T10:00:00Z  ---> 1a2b3c4d
+2024-01-01T10:00:01Z Step 2/4 : WORKDIR /app
+2024-01-01T10:00:01Z  ---> Using cache
+2024-01-01T10:00:01Z Step 3/4 : RUN npm install
+2024-01-01T10:00:31Z Step 4/4 : RUN npm run build
+2024-01-01T10:01:01Z Successfully built 5e6f7a8b
+"""
+
+NIXPACKS_LOG = """\
+╔════════ Nixpacks v1.21.0 ═══════╗
+║ setup      │ nodejs_18, npm-9x  ║
+║─────────────────────────────────║
+║ install    │ npm ci             ║
+║─────────────────────────────────║
+║ build      │ npm run build      ║
+║─────────────────────────────────║
+║ start      │ npm run start      ║
+╚═════════════════════════════════╝
+#9 [stage-0  6/10] RUN --mount=type=cache,id=s/abc-/root/npm,target=/root/.npm npm ci
+#9 DONE 30.5s
+"""
+
+
+def test_buildkit_steps():
+    steps = {step['id']: step for step in parse_build_steps(BUILDKIT_LOG)['steps']}
+
+    assert steps['1']['label'] == 'internal'
+    assert steps['5']['cached'] and steps['5']['duration'] == 0.0
+    assert steps['7']['command'] == 'RUN npm ci'
+    assert steps['7']['phase'] == 'npm_install'
+    assert steps['7']['duration'] == 45.2
+    assert steps['8']['phase'] == 'vite_build'
+    assert steps['8']['status'] == 'error'
+    assert steps['8']['duration'] == 3.1
+
+
+def test_legacy_steps_use_timestamps():
+    steps = parse_build_steps(LEGACY_LOG)['steps']
+
+    assert [step['label'] for step in steps] == ['1/4', '2/4', '3/4', '4/4']
+    assert steps[1]['cached']
+    assert steps[2]['phase'] == 'npm_install'
+    assert steps[2]['duration'] == 30.0
+    assert steps[3]['phase'] == 'vite_build'
+    assert steps[3]['duration'] == 30.0
+
+
+def test_nixpacks_plan_and_mount_options():
+    parsed = parse_build_steps(NIXPACKS_LOG)
+
+    assert parsed['nixpacks_plan']['install'] == 'npm ci'
+    assert parsed['nixpacks_plan']['build'] == 'npm run build'
+    step = parsed['steps'][0]
+    assert step['command'] == 'RUN npm ci'
+    assert step['phase'] == 'npm_install'
+    assert step['duration'] == 30.5
+
+
+def test_classify_yarn_and_pnpm():
+    assert classify_step('RUN yarn') == 'npm_install'
+    assert classify_step('RUN yarn install --frozen-lockfile') == 'npm_install'
+    assert classify_step('RUN pnpm i') == 'npm_install'
+    assert classify_step('RUN yarn build') == 'vite_build'
+    assert classify_step('RUN pnpm run build') == 'vite_build'
+    assert classify_step('RUN yarn lint') is None
@@ -0,0 +1,66 @@
+from runtime_signals import extract_runtime_signals, percentile
+
+
+def test_percentile_empty():
+    assert percentile([], 95) is None
+
+
+def test_percentile_single_value():
+    assert percentile([42], 50) == 42
+    assert percentile([42], 99) == 42
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+
+
+def test_percentile_small_lists():
+    assert percentile([1, 2], 50) == 1
+    assert percentile([1, 2], 51) == 2
+    assert percentile([3, 1, 2], 0) == 1
+
+
+def test_heap_oom_followed_by_kill_counts_once():
+    logs = "\n".join([
+        "Starting Container",
+        "FATAL ERROR: Reached heap limit Allocation failed - JavaScript heap out of memory",
+        "Container OOMKilled",
+        "Process exited with code 137",
+    ])
+    assert extract_runtime_signals(logs)['oom_kills'] == 1
+
+
+def test_kill_without_oom_message_counts():
+    logs = "Starting Container\nProcess exited with code 137\n"
+    assert extract_runtime_signals(logs)['oom_kills'] == 1
+
+
+def test_each_crash_between_restarts_counts():
+    crash = "JavaScript heap out of memory\nexit code 137"
+    logs = "\n".join(["Starting Container", crash, "Starting Container", crash])
+    signals = extract_runtime_signals(logs)
+    assert signals['oom_kills'] == 2
+    assert signals['restarts'] == 1
+
+
+def test_duration_needs_request_marker():
+    logs = "\n".join([
+        "Migration took 3s",
+        "GET /api/agents 200 12.5 ms",
+        "request /api/tasks duration=40ms",
+    ])
+    values = [point['value'] for point in extract_runtime_signals(logs)['series']['request_ms']]
+    assert values == [12.5, 40.0]
+
+
+def test_restart_limit_requires_restarts_under_on_failure():
+    signals = extract_runtime_signals("", max_retries=0, restart_policy_type='ON_FAILURE')
+    assert not signals['restart_limit_reached']
+
+    logs = "Starting Container\n" * 4
+    assert extract_runtime_signals(logs, max_retries=3, restart_policy_type='ON_FAILURE')['restart_limit_reached']
+    assert not extract_runtime_signals(logs, max_retries=3, restart_policy_type='ALWAYS')['restart_limit_reached']
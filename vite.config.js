@@ -1,8 +1,14 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
-export default defineConfig({
+export default defineConfig(({ mode }) => ({
   plugins: [react()],
+  build: {
+    manifest: true,
+    // Sourcemaps only for `npm run build:analyze` (bundle_analyzer.py module
+    // attribution); deploy builds stay without them
+    sourcemap: mode === 'analyze' ? 'hidden' : false,
+  },
   server: {
     port: 3000,
     proxy: {
@@ -12,4 +18,4 @@ export default defineConfig({
       },
     },
   },
-})
+}))